@@ -0,0 +1,61 @@
+"""Add composite lookup indexes to chat and messages tables
+
+Revision ID: rev20250301_lookup_indexes
+Revises: rev20250229_add_vectors
+Create Date: 2025-12-01 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "rev20250301_lookup_indexes"
+down_revision: Union[str, None] = "rev20250229_add_vectors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _get_indexes(table_name: str, schema: str = "public") -> set[str]:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return {idx["name"] for idx in inspector.get_indexes(table_name, schema=schema)}
+
+
+def upgrade() -> None:
+    # (사용자, 종목, 휴지통 상태) 채팅방 조회 및 사용자별 채팅방 목록
+    if "ix_chat_user_stock_trash" not in _get_indexes("chat"):
+        op.create_index(
+            "ix_chat_user_stock_trash",
+            "chat",
+            ["user_id", "stock_code", "trash_can"],
+            unique=False,
+            schema="public",
+        )
+
+    # 채팅방별 메시지 조회 (messages_id > last_message_id 범위 스캔 + 정렬)
+    if "ix_messages_chat_id_messages_id" not in _get_indexes("messages"):
+        op.create_index(
+            "ix_messages_chat_id_messages_id",
+            "messages",
+            ["chat_id", "messages_id"],
+            unique=False,
+            schema="public",
+        )
+
+
+def downgrade() -> None:
+    if "ix_messages_chat_id_messages_id" in _get_indexes("messages"):
+        op.drop_index(
+            "ix_messages_chat_id_messages_id",
+            table_name="messages",
+            schema="public",
+        )
+
+    if "ix_chat_user_stock_trash" in _get_indexes("chat"):
+        op.drop_index(
+            "ix_chat_user_stock_trash",
+            table_name="chat",
+            schema="public",
+        )
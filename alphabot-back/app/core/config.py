@@ -32,6 +32,17 @@ class Settings(BaseSettings):
     db_port: Optional[int] = Field(default=None, alias="DB_PORT")
     db_user: Optional[str] = Field(default=None, alias="DB_USER")
 
+    # 비동기 엔진 커넥션 풀 설정 (최소 유지 커넥션 / 최대 커넥션 / 재활용 주기(초))
+    db_pool_min: int = Field(default=5, alias="DB_POOL_MIN")
+    db_pool_max: int = Field(default=20, alias="DB_POOL_MAX")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    # 커넥션별 prepared statement 캐시 크기 (asyncpg), 엔진 전체 SQL 컴파일 캐시 크기
+    db_statement_cache_size: int = Field(default=1024, alias="DB_STATEMENT_CACHE_SIZE")
+    db_query_cache_size: int = Field(default=1200, alias="DB_QUERY_CACHE_SIZE")
+
+    # 선택적 Redis 캐시 (없으면 캐시 비활성화)
+    redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
+
     # fallback sqlite path for local development
     sqlite_path: str = Field(
         default=f"sqlite:///{(_PROJECT_ROOT / 'alphabot-back' / 'alphabot.db').as_posix()}",
@@ -42,6 +53,12 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "secret_key" #나중에 키 수정
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 비대칭 알고리즘(EdDSA, RS256, ES256 등) 사용 시 PEM 형식 키
+    JWT_PRIVATE_KEY: Optional[str] = None
+    JWT_PUBLIC_KEY: Optional[str] = None
+
+    # 비밀번호 해시/검증(bcrypt)을 실행할 스레드 수
+    PWD_THREADS: int = 16
 
     def model_post_init(self, __context: Any) -> None:  # type: ignore[override]
         if self.database_url:
@@ -1,39 +1,102 @@
-from fastapi import Depends, HTTPException, status
+import time
+
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 import jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.core.config import settings
-from app.core.security import oauth2_scheme
-from app.db import get_db
+from app.core.security import decode_access_token, oauth2_scheme
+from app.db import AsyncSessionLocal
 from app.models.models import User
 # from app.routers.auth import get_user
 from app.schemas.auth_token import TokenData
 
 from app.crud import crud_user
 
-#jwt토큰 디코딩한다음 사용자 정보 조회. 인증이 필요한 모든api들에서 가져다 사용함.
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """토큰을 디코딩하고 현재 사용자 정보를 반환"""
-    credentials_exception = HTTPException(
+# 짧은 시간 안에 같은 토큰으로 몰리는 요청이 매번 jwt 검증 + 사용자 SELECT를 하지 않도록
+# 토큰 -> (사용자 컬럼 값 튜플, 만료 시각) 을 몇 초간 캐시
+# ORM 객체 하나를 동시 요청끼리 공유하지 않도록 불변 스냅샷만 저장하고, 요청마다 새 User를 만듦
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+_USER_SNAPSHOT_COLUMNS = ("user_id", "login_id", "username", "hashed_pw", "created_at")
+_LOGIN_ID_INDEX = _USER_SNAPSHOT_COLUMNS.index("login_id")
+
+
+def _snapshot_user(user: User) -> tuple:
+    return tuple(getattr(user, column) for column in _USER_SNAPSHOT_COLUMNS)
+
+
+def _user_from_snapshot(snapshot: tuple) -> User:
+    """스냅샷으로 세션에서 분리된(detached) 상태의 새 User를 만듦 (읽기 전용 — 수정은 crud_user가 최신 행을 다시 읽어 수행)"""
+    user = User(**dict(zip(_USER_SNAPSHOT_COLUMNS, snapshot)))
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_user_cache(login_id: str) -> None:
+    """프로필/비밀번호 변경 시 해당 사용자의 캐시 항목을 모두 제거"""
+    stale_tokens = [
+        token
+        for token, (snapshot, _) in list(_USER_CACHE.items())
+        if snapshot[_LOGIN_ID_INDEX] == login_id
+    ]
+    for token in stale_tokens:
+        _USER_CACHE.pop(token, None)
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def resolve_user_from_token(token: str) -> User | None:
+    """토큰을 디코딩해 사용자를 조회. 토큰이 유효하지 않거나 사용자가 없으면 None"""
+    cached = _USER_CACHE.get(token)
+    if cached is not None:
+        snapshot, exp = cached
+        if exp is None or exp > time.time():
+            return _user_from_snapshot(snapshot)
+        _USER_CACHE.pop(token, None)
+
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_access_token(token)
         #페이로드 sub 값을 login_id로 사용.
         login_id: str | None = payload.get("sub")
         if login_id is None:
-            raise credentials_exception
+            return None
         #없어도 되는데 호환성위해서 놔둠
         token_data = TokenData(username=login_id)
     except jwt.PyJWTError:
-        raise credentials_exception
+        return None
 
     # crud_user의 함수를 써서 login_id로 사용자를 찾기
-    user = crud_user.get_user_by_login_id(db, login_id=token_data.username)
+    # 요청 전체(예: OpenAI 호출 대기) 동안 커넥션을 붙잡지 않도록 조회 후 바로 세션을 닫음
+    async with AsyncSessionLocal() as db:
+        user = await crud_user.get_user_by_login_id(db, login_id=token_data.username)
+    if user is None:
+        return None
+    _USER_CACHE[token] = (_snapshot_user(user), payload.get("exp"))
+    return user
+
+
+#jwt토큰 디코딩한다음 사용자 정보 조회. 인증이 필요한 모든api들에서 가져다 사용함.
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    """토큰을 디코딩하고 현재 사용자 정보를 반환"""
+    user = await resolve_user_from_token(token)
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+
+async def get_request_user(request: Request, token: str = Depends(oauth2_scheme)) -> User:
+    """AuthMiddleware가 요청당 한 번 조회해 둔 request.state.user를 반환
+
+    I/O가 없으므로 스레드풀로 넘기지 않도록 async로 선언
+
+    token 파라미터는 OpenAPI 문서의 Bearer 인증 표시와 헤더 누락 시 401 응답용으로만 사용
+    """
+    user = getattr(request.state, "user", None)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
@@ -0,0 +1,58 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.dependencies import resolve_user_from_token
+
+logger = logging.getLogger(__name__)
+
+# request.state.user를 사용하는 채팅 API 경로 (다른 라우트는 get_current_user로 직접 조회)
+CHAT_PATH_PREFIXES = ("/api/rooms", "/api/v1/chats")
+
+
+class AuthMiddleware:
+    """Authorization: Bearer 토큰으로 사용자를 요청당 한 번만 조회해 request.state.user에 저장
+
+    응답 스트리밍(SSE)을 감싸지 않도록 BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현.
+    토큰이 없거나 유효하지 않으면 user는 None이며, 401 처리는 라우트 의존성(get_request_user)이 담당.
+    사용자 조회 중 DB 오류는 503, 그 밖의 토큰 처리 오류는 401로 바로 응답합니다.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...] = CHAT_PATH_PREFIXES) -> None:
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        user = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    try:
+                        user = await resolve_user_from_token(token.strip())
+                    except (SQLAlchemyError, OSError) as exc:
+                        logger.exception("[auth] 사용자 조회 실패: %s", exc)
+                        response = JSONResponse(
+                            {"detail": "Authentication service unavailable"}, status_code=503
+                        )
+                        await response(scope, receive, send)
+                        return
+                    except Exception as exc:
+                        logger.warning("[auth] 토큰 처리 실패: %s", exc)
+                        response = JSONResponse(
+                            {"detail": "Could not validate credentials"},
+                            status_code=401,
+                            headers={"WWW-Authenticate": "Bearer"},
+                        )
+                        await response(scope, receive, send)
+                        return
+                break
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
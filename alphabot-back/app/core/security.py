@@ -1,6 +1,11 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import jwt
+from cachetools import TTLCache
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 
@@ -9,6 +14,48 @@ from app.core.config import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/login")
 
+# bcrypt는 CPU를 수십 ms 점유하므로 이벤트 루프 밖의 전용 스레드풀에서 실행
+PWD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.PWD_THREADS, thread_name_prefix="pwd-hash"
+)
+
+_HMAC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+
+
+def _load_jwt_keys() -> tuple[Any, Any]:
+    """서명/검증 키를 시작 시 한 번만 준비해 (signing_key, verification_key)로 반환
+
+    - HS*: SECRET_KEY를 bytes로 한 번만 변환
+    - EdDSA/RS*/ES*: PEM을 cryptography 키 객체로 미리 파싱해 두어
+      토큰 발급/검증마다 PEM을 다시 읽지 않도록 함
+    """
+    if settings.ALGORITHM in _HMAC_ALGORITHMS:
+        secret = settings.SECRET_KEY.encode("utf-8")
+        return secret, secret
+
+    from cryptography.hazmat.primitives import serialization
+
+    if not settings.JWT_PRIVATE_KEY or not settings.JWT_PUBLIC_KEY:
+        raise RuntimeError(
+            f"{settings.ALGORITHM} 알고리즘에는 JWT_PRIVATE_KEY/JWT_PUBLIC_KEY(PEM) 설정이 필요합니다."
+        )
+    # .env 한 줄에 넣은 PEM의 \n 이스케이프를 실제 줄바꿈으로 복원
+    private_pem = settings.JWT_PRIVATE_KEY.replace("\\n", "\n").encode("utf-8")
+    public_pem = settings.JWT_PUBLIC_KEY.replace("\\n", "\n").encode("utf-8")
+    return (
+        serialization.load_pem_private_key(private_pem, password=None),
+        serialization.load_pem_public_key(public_pem),
+    )
+
+
+_JWT_SIGNING_KEY, _JWT_VERIFICATION_KEY = _load_jwt_keys()
+
+# 같은 토큰의 반복 검증(HMAC + JSON 파싱)을 건너뛰기 위한 디코딩 결과 캐시.
+# 항목 수명은 토큰 수명을 넘지 않으며, 히트 시에도 exp를 다시 확인한다.
+_TOKEN_CACHE: TTLCache = TTLCache(
+    maxsize=4096, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호가 해시와 일치하는지 확인"""
@@ -20,6 +67,20 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 스레드풀에서 실행해 이벤트 루프를 막지 않고 검증"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        PWD_EXECUTOR, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash를 스레드풀에서 실행해 이벤트 루프를 막지 않고 해시"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PWD_EXECUTOR, get_password_hash, password)
+
+
 def create_access_token(data: dict) -> str:
     """jwt 액세스 토큰을 생성"""
     to_encode = data.copy()
@@ -28,6 +89,21 @@ def create_access_token(data: dict) -> str:
     )
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        to_encode, _JWT_SIGNING_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """jwt 토큰을 검증/디코딩. 만료 전까지는 캐시된 payload를 반환"""
+    payload = _TOKEN_CACHE.get(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        _TOKEN_CACHE.pop(token, None)
+
+    # 만료/위조 토큰은 여기서 jwt.PyJWTError를 발생시키며 캐시에 저장되지 않음
+    payload = jwt.decode(token, _JWT_VERIFICATION_KEY, algorithms=[settings.ALGORITHM])
+    _TOKEN_CACHE[token] = payload
+    return payload
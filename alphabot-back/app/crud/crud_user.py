@@ -1,13 +1,15 @@
-from sqlalchemy.orm import Session
-from app.core.security import get_password_hash
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import get_password_hash_async
 from app.models.models import User
 from app.schemas.user import UserCreate, UserUpdate
 
-def get_user_by_login_id(db: Session, *, login_id: str) -> User | None:
+async def get_user_by_login_id(db: AsyncSession, *, login_id: str) -> User | None:
     """login_id로 사용자를 조회합니다."""
-    return db.query(User).filter(User.login_id == login_id).first()
+    result = await db.execute(select(User).where(User.login_id == login_id))
+    return result.scalar_one_or_none()
 
-def create_user(db: Session, *, obj_in: UserCreate) -> User:
+async def create_user(db: AsyncSession, *, obj_in: UserCreate) -> User:
     """새로운 사용자를 생성합니다."""
     # UserCreate 스키마데이터를 딕셔너리로 변환
     create_data = obj_in.dict()
@@ -15,36 +17,45 @@ def create_user(db: Session, *, obj_in: UserCreate) -> User:
     create_data.pop("password")
     db_obj = User(
         **create_data,
-        hashed_pw=get_password_hash(obj_in.password)
+        hashed_pw=await get_password_hash_async(obj_in.password)
     )
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     return db_obj
 
-def update_user(db: Session, *, db_user: User, obj_in: UserUpdate) -> User:
-    """사용자 프로필(이름 등)을 수정합니다."""
+async def update_user(db: AsyncSession, *, db_user: User, obj_in: UserUpdate) -> User | None:
+    """사용자 프로필(이름 등)을 수정합니다. 사용자가 없으면 None을 반환합니다."""
     # 변경 요청된 데이터만 딕셔너리로 변환 (null 값 제외)
     update_data = obj_in.dict(exclude_unset=True)
-    
+    # 인증 의존성이 캐시한 사용자 스냅샷은 몇 초 전 값일 수 있으므로 merge하지 않고
+    # 이 세션에서 최신 행을 읽어 변경된 필드만 수정 (다른 워커의 비밀번호 변경 등을 덮어쓰지 않도록)
+    db_user = await db.get(User, db_user.user_id)
+    if db_user is None:
+        return None
+
     # DB 객체 속성 업데이트
     for field, value in update_data.items():
         setattr(db_user, field, value)
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
-def update_password(db: Session, *, db_user: User, new_password: str) -> User:
-    """사용자의 비밀번호를 변경합니다."""
+async def update_password(db: AsyncSession, *, db_user: User, new_password: str) -> User | None:
+    """사용자의 비밀번호를 변경합니다. 사용자가 없으면 None을 반환합니다."""
     # 새 비밀번호를 해시화(암호화)하여 저장
-    hashed_password = get_password_hash(new_password)
+    hashed_password = await get_password_hash_async(new_password)
+    # 캐시된 스냅샷을 merge하지 않고 최신 행의 비밀번호 컬럼만 수정
+    db_user = await db.get(User, db_user.user_id)
+    if db_user is None:
+        return None
     db_user.hashed_pw = hashed_password
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 # 전역 변수로 crud 객체를 만들어두면 다른 곳에서 임포트하여 사용하기 편리합니다.
@@ -2,6 +2,23 @@
 
 from app.models.models import Base
 
-from .session import SessionLocal, engine, get_db
+from .session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_async_db,
+    get_async_sessionmaker,
+    get_db,
+)
 
-__all__ = ("engine", "SessionLocal", "get_db", "Base")
+__all__ = (
+    "engine",
+    "SessionLocal",
+    "get_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
+    "get_async_sessionmaker",
+    "Base",
+)
@@ -0,0 +1,62 @@
+"""Redis 기반의 선택적 읽기 캐시.
+
+REDIS_URL이 없거나 redis 패키지가 설치되지 않은 환경에서는 캐시를 비활성화하고,
+모든 조회는 캐시 미스로 처리되어 DB로 바로 넘어갑니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import orjson
+
+from app.core import settings
+
+try:
+    from redis import asyncio as redis_asyncio  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - optional dependency
+    redis_asyncio = None  # type: ignore
+
+
+if settings.redis_url and redis_asyncio is not None:
+    # from_url은 내부적으로 커넥션 풀을 만들어 요청 간에 연결을 재사용
+    redis_client = redis_asyncio.from_url(settings.redis_url, max_connections=50)
+else:
+    redis_client = None
+    print("[cache] REDIS_URL이 없거나 redis 패키지가 없어 Redis 캐시를 비활성화합니다.", flush=True)
+
+
+def is_cache_configured() -> bool:
+    return redis_client is not None
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """캐시된 JSON 값을 반환. 캐시 미사용/미스/장애 시 None"""
+    if redis_client is None:
+        return None
+    try:
+        raw = await redis_client.get(key)
+    except Exception as exc:  # pragma: no cover - 캐시 장애는 DB 조회로 대체
+        print(f"[cache] GET 실패 ({key}): {exc}", flush=True)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """값을 JSON으로 직렬화해 TTL과 함께 저장"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl_seconds, orjson.dumps(value))
+    except Exception as exc:  # pragma: no cover
+        print(f"[cache] SETEX 실패 ({key}): {exc}", flush=True)
+
+
+async def cache_delete(*keys: str) -> None:
+    """쓰기 후 관련 캐시 키를 무효화"""
+    if redis_client is None or not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except Exception as exc:  # pragma: no cover
+        print(f"[cache] DEL 실패 ({keys}): {exc}", flush=True)
@@ -33,7 +33,15 @@ NEWS_DB_URL = _build_news_db_url()
 NewsBase = declarative_base()
 
 if NEWS_DB_URL:
-    NewsEngine: Engine = create_engine(NEWS_DB_URL, echo=False, pool_pre_ping=True)
+    # RAG 검색은 요청당 여러 건이 스레드풀에서 동시에 실행되므로 기본 풀(5개)보다 크게 잡음
+    NewsEngine: Engine = create_engine(
+        NEWS_DB_URL,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=int(os.getenv("NEWS_DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("NEWS_DB_MAX_OVERFLOW", "20")),
+        pool_recycle=int(os.getenv("NEWS_DB_POOL_RECYCLE", "1800")),
+    )
     NewsSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=NewsEngine)
 else:
     NewsEngine = None  # type: ignore
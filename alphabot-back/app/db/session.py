@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core import settings
 
+# 동기 드라이버 URL을 같은 DB를 가리키는 비동기 드라이버 URL로 변환하기 위한 매핑
+_ASYNC_DRIVER_PREFIXES = (
+    ("postgresql+psycopg://", "postgresql+asyncpg://"),
+    ("postgresql://", "postgresql+asyncpg://"),
+    ("sqlite:///", "sqlite+aiosqlite:///"),
+)
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """Return QueuePool sizing shared by the sync and async engines."""
+
+    # 동시 요청이 기본 풀(5개)에서 커넥션을 기다리며 줄 서지 않도록 크기를 설정값에 맞춤
+    pool_min = max(settings.db_pool_min, 1)
+    return {
+        "pool_size": pool_min,
+        "max_overflow": max(settings.db_pool_max - pool_min, 0),
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 
 def _engine_kwargs(database_url: str) -> Dict[str, Any]:
     """Return engine configuration tuned for the selected backend."""
@@ -17,13 +37,59 @@ def _engine_kwargs(database_url: str) -> Dict[str, Any]:
     if database_url.startswith("sqlite"):
         # SQLite는 단일 스레드 접근만 허용하므로 FastAPI 개발 서버용 예외 처리.
         kwargs["connect_args"] = {"check_same_thread": False}
+        return kwargs
+
+    # 동기 라우터(북마크/카테고리/댓글)는 스레드풀에서 동시에 실행되므로 풀 크기를 맞춰 둠
+    kwargs.update(_pool_kwargs())
+    return kwargs
+
+
+def _async_database_url(database_url: str) -> str:
+    """Return the async-driver equivalent of the configured database URL."""
+
+    for sync_prefix, async_prefix in _ASYNC_DRIVER_PREFIXES:
+        if database_url.startswith(sync_prefix):
+            return async_prefix + database_url[len(sync_prefix):]
+    return database_url
+
+
+def _async_engine_kwargs(database_url: str) -> Dict[str, Any]:
+    """Return async engine configuration tuned for the selected backend."""
+
+    # 같은 모양의 쿼리는 SQL 문자열 컴파일 결과를 재사용
+    kwargs: Dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": True,
+        "query_cache_size": settings.db_query_cache_size,
+    }
+    if database_url.startswith("sqlite"):
+        return kwargs
+
+    if database_url.startswith("postgresql+asyncpg"):
+        # 커넥션마다 prepared statement를 캐시해 반복 쿼리의 parse/plan 비용을 생략
+        kwargs["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+
+    # 요청마다 연결을 새로 맺지 않도록 오래 유지되는 커넥션을 풀에 두고 재사용
+    kwargs.update(_pool_kwargs())
     return kwargs
 
 
 engine = create_engine(settings.database_url, **_engine_kwargs(settings.database_url))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
- 
+ASYNC_DATABASE_URL = _async_database_url(settings.database_url)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_engine_kwargs(ASYNC_DATABASE_URL))
+# 커밋 후에도 응답 직렬화 시 lazy load(비동기에서 불가)가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 def get_db():
     """FastAPI dependency that yields a database session."""
 
@@ -32,3 +98,20 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency that yields an async database session."""
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """FastAPI dependency that returns the async session factory.
+
+    Endpoints that call slow external services (e.g. OpenAI) open short-lived
+    sessions themselves so no pooled connection is held during the call.
+    """
+
+    return AsyncSessionLocal
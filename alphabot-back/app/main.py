@@ -5,9 +5,11 @@ from pathlib import Path
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from app.core.middleware import AuthMiddleware
 from app.db import engine, get_db, Base
 from app.routers import auth, chat, user, category, bookmark, comment
 
@@ -38,6 +40,10 @@ ALLOWED_CORS_ORIGINS = [*DEFAULT_CORS_ORIGINS, *ADDITIONAL_CORS_ORIGINS]
 if ADDITIONAL_CORS_ORIGINS:
     logger.warning("Allowing additional CORS origins: %s", ADDITIONAL_CORS_ORIGINS)
 
+# 채팅 API의 JWT 검증 + 사용자 조회를 요청당 한 번만 수행해 request.state.user에 저장
+# (나중에 추가한 미들웨어가 바깥쪽이므로 CORS보다 먼저 등록해 오류 응답에도 CORS 헤더가 붙도록 함)
+app.add_middleware(AuthMiddleware)
+
 # CORS 설정: 프론트엔드 접근 허용 (개발 + 배포)
 app.add_middleware(
     CORSMiddleware,
@@ -45,8 +51,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+# 1KB 이상 응답은 gzip 압축 (text/event-stream 스트리밍 응답은 Starlette 0.46+가 압축 대상에서 제외 -> requirements에서 하한 고정)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 @app.on_event("startup")
 def on_startup() -> None:
     # 테이블 생성 (없으면)
@@ -72,6 +72,8 @@ class Chat(Base):
             unique=True,
             postgresql_where=text("stock_code IS NOT NULL AND trash_can = 'out'")
         ),
+        # (사용자, 종목, 휴지통 상태) 조회 및 사용자별 채팅방 목록용 복합 인덱스
+        Index('ix_chat_user_stock_trash', 'user_id', 'stock_code', 'trash_can'),
         {'schema': 'public'},
     )
 
@@ -103,7 +105,11 @@ class Chat(Base):
 
 class Message(Base):
     __tablename__ = 'messages'
-    __table_args__ = {'schema': 'public'}
+    __table_args__ = (
+        # 채팅방별 메시지를 ID 순으로 조회 (last_message_id 이후 증분 조회 포함)
+        Index('ix_messages_chat_id_messages_id', 'chat_id', 'messages_id'),
+        {'schema': 'public'},
+    )
 
     messages_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('public.users.user_id', ondelete="CASCADE"), nullable=False)
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, verify_password
-from app.db import get_db
+from app.core.security import create_access_token, verify_password_async
+from app.db import get_async_db
 from app.schemas.auth_token import Token
 from app.crud import crud_user #user모델 직점참조에서 crud함수를 사용으로 변경
 
@@ -17,13 +17,13 @@ router = APIRouter()#태그를 auth로 통일하여서 수정.
 
 
 @router.post("/login", response_model=Token)
-def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 인증 후 jwt 액세스 토큰을 발급"""
-    user = crud_user.get_user_by_login_id(db, login_id=form_data.username)#사용자조회
+    user = await crud_user.get_user_by_login_id(db, login_id=form_data.username)#사용자조회
 
-    if not user or not verify_password(form_data.password, user.hashed_pw):#비밀번호검증
+    if not user or not await verify_password_async(form_data.password, user.hashed_pw):#비밀번호검증
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
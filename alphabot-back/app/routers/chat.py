@@ -1,9 +1,12 @@
+import hashlib
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.dependencies import get_current_user
-from app.db import get_db
+from app.core.dependencies import get_request_user
+from app.db import get_async_db, get_async_sessionmaker
 from app.schemas.chats import (
     MessageCreate,
     MessageRead,
@@ -13,6 +16,8 @@ from app.schemas.chats import (
     ChatByStockResponse,
     ChatCompletionRequest,
     ChatCompletionResponse,
+    ChatCompletionAcceptedResponse,
+    message_read_from_orm,
 )
 from app.models.models import User
 from app.services.chat_service import (
@@ -20,25 +25,68 @@ from app.services.chat_service import (
     upsert_chat_by_stock,
     save_user_message,
     create_message_and_reply,
+    stream_message_and_reply,
+    save_user_message_for_reply,
+    generate_reply_in_background,
     fetch_chat_messages,
+    get_chat_messages_version,
     list_user_chat_rooms,
     create_chat_room_for_user,
     get_chat_room_by_stock_for_user,
     update_chat_room_for_user,
 )
 
+# 응답 JSON 직렬화는 response_model 기반 pydantic 직렬화(또는 목록/완료 응답의 dump_json)로 처리
+# 인증은 각 라우트의 current_user 파라미터(get_request_user)가 담당
 router = APIRouter(tags=["chat"])
 
+# 메시지 목록 직렬화기는 요청마다 만들지 않도록 import 시점에 한 번만 생성
+# 목록 응답은 값이 없는 필드(null)를 생략해 직렬화/전송량을 줄임
+MESSAGE_LIST_ADAPTER = TypeAdapter(List[MessageRead])
+CHAT_LIST_ADAPTER = TypeAdapter(List[ChatRead])
+
+# 목록 조회 최대 페이지 크기 (limit을 주면 다음 페이지가 있을 때 X-Next-Cursor 헤더로 커서를 알려줌)
+# limit을 생략하면 기존 클라이언트와 같이 전체 목록을 반환
+MAX_PAGE_SIZE = 500
+
+
+def _make_etag(raw: bytes) -> str:
+    return '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 여러 개, W/ 접두사 허용)에 etag가 포함되는지 확인"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _with_next_cursor(headers: dict, items: list, limit: int | None, cursor_of) -> dict:
+    """페이지가 가득 찼으면 마지막 항목의 키를 X-Next-Cursor 헤더로 추가 (limit 미지정 시 생략)"""
+    if limit is not None and items and len(items) >= limit:
+        headers["X-Next-Cursor"] = str(cursor_of(items[-1]))
+    return headers
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag))
+
 
 @router.post("/rooms/{room_id}/messages", response_model=MessageRead)
-def create_message(
+async def create_message(
     room_id: int,
     message: MessageCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
     """특정 채팅방에 메시지를 전송하고 DB에 저장"""
-    db_message = save_user_message(db, room_id=room_id, current_user=current_user, message=message)
+    db_message = await save_user_message(db, room_id=room_id, current_user=current_user, message=message)
     return db_message
 
 
@@ -47,54 +95,166 @@ def create_message(
     response_model=ChatCompletionResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_message_with_openai(
+async def create_message_with_openai(
     room_id: int,
     request: ChatCompletionRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_sessionmaker),
+    current_user: User = Depends(get_request_user),
 ):
     """사용자 메시지를 저장하고 OpenAI 응답을 생성하여 함께 반환"""
-    user_message, assistant_message = create_message_and_reply(
-        db,
+    user_message, assistant_message = await create_message_and_reply(
+        session_factory,
         room_id=room_id,
         current_user=current_user,
         message=MessageCreate(content=request.content),
         system_prompt=request.system_prompt,
     )
     
-    return ChatCompletionResponse(user_message=user_message, assistant_message=assistant_message)
+    # 방금 저장한 ORM 행이므로 재검증 없이 바로 JSON으로 직렬화
+    response = ChatCompletionResponse.model_construct(
+        user_message=message_read_from_orm(user_message),
+        assistant_message=message_read_from_orm(assistant_message),
+    )
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
+
+
+@router.post(
+    "/rooms/{room_id}/chat-completions/async",
+    response_model=ChatCompletionAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_message_with_openai_async(
+    room_id: int,
+    request: ChatCompletionRequest,
+    background_tasks: BackgroundTasks,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_sessionmaker),
+    current_user: User = Depends(get_request_user),
+):
+    """사용자 메시지만 저장해 바로 202로 응답하고, OpenAI 응답 생성/저장은 백그라운드에서 수행"""
+    user_message, chat = await save_user_message_for_reply(
+        session_factory,
+        room_id=room_id,
+        current_user=current_user,
+        message=MessageCreate(content=request.content),
+    )
+    background_tasks.add_task(
+        generate_reply_in_background,
+        session_factory,
+        room_id=room_id,
+        user_id=current_user.user_id,
+        stock_code=chat.stock_code,
+        latest_user_text=request.content,
+        system_prompt=request.system_prompt,
+    )
+
+    response = ChatCompletionAcceptedResponse.model_construct(
+        user_message=message_read_from_orm(user_message),
+    )
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+    )
+
+
+@router.post("/rooms/{room_id}/chat-completions/stream")
+async def stream_message_with_openai(
+    room_id: int,
+    request: ChatCompletionRequest,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_sessionmaker),
+    current_user: User = Depends(get_request_user),
+):
+    """OpenAI 응답을 Server-Sent Events로 스트리밍하고, 완료 시 사용자/어시스턴트 메시지를 저장"""
+    events = await stream_message_and_reply(
+        session_factory,
+        room_id=room_id,
+        current_user=current_user,
+        message=MessageCreate(content=request.content),
+        system_prompt=request.system_prompt,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/rooms/{room_id}/messages", response_model=List[MessageRead])
-def get_messages(
+async def get_messages(
     room_id: int,
+    request: Request,
     last_message_id: int | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
-    """특정 채팅방의 메시지 내역을 조회"""
-    return fetch_chat_messages(
+    """특정 채팅방의 메시지 내역을 조회 (last_message_id 이후, limit 지정 시 limit개씩 / ETag 지원)"""
+    # 목록 전체 대신 (마지막 ID, 개수)만 조회해 ETag를 만들고, 변경이 없으면 304로 응답
+    last_id, count = await get_chat_messages_version(
         db,
         room_id=room_id,
         current_user=current_user,
         last_message_id=last_message_id,
     )
+    etag = _make_etag(f"{room_id}:{last_message_id}:{limit}:{last_id}:{count}".encode())
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    messages = await fetch_chat_messages(
+        db,
+        room_id=room_id,
+        current_user=current_user,
+        last_message_id=last_message_id,
+        verify_owner=False,
+        limit=limit,
+    )
+    return Response(
+        content=MESSAGE_LIST_ADAPTER.dump_json(
+            [message_read_from_orm(m) for m in messages], exclude_none=True
+        ),
+        media_type="application/json",
+        headers=_with_next_cursor(
+            _etag_headers(etag), messages, limit, lambda m: m.messages_id
+        ),
+    )
 
 
 @router.get("/rooms", response_model=List[ChatRead])
-def get_chat_rooms(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+async def get_chat_rooms(
+    request: Request,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: int | None = Query(default=None, description="이전 페이지 X-Next-Cursor 값"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
-    """현재 사용자가 참여 중인 모든 채팅방 목록을 조회"""
-    return list_user_chat_rooms(db, current_user=current_user)
+    """현재 사용자의 채팅방 목록을 최근 대화 순으로 조회 (limit 지정 시 limit개씩 / ETag 지원)"""
+    rooms = await list_user_chat_rooms(
+        db, current_user=current_user, limit=limit, cursor=cursor
+    )
+    # 제목/휴지통 상태 변경도 반영되도록 직렬화된 본문으로 ETag를 계산 (전송량만 절약)
+    body = CHAT_LIST_ADAPTER.dump_json(
+        [ChatRead.model_validate(room) for room in rooms], exclude_none=True
+    )
+    etag = _make_etag(body)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_with_next_cursor(_etag_headers(etag), rooms, limit, lambda room: room.chat_id),
+    )
 
 
 @router.put("/v1/chats/by-stock/{stock_code}", response_model=ChatByStockResponse)
-def enter_chat_by_stock(
+async def enter_chat_by_stock(
     stock_code: str,
     title: str | None = Query(default=None, max_length=100, description="신규 생성 시 사용할 제목"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
     """사용자/종목 조합으로 채팅방을 조회하거나 생성 후 chat_id를 반환"""
     try:
@@ -106,7 +266,7 @@ def enter_chat_by_stock(
         normalized_title = title.strip()
     else:
         normalized_title = None
-    chat, existed = upsert_chat_by_stock(
+    chat, existed = await upsert_chat_by_stock(
         db,
         user=current_user,
         stock_code=normalized_code,
@@ -120,37 +280,37 @@ def enter_chat_by_stock(
         existed=existed,
     )
 @router.post("/rooms", response_model=ChatRead, status_code=status.HTTP_201_CREATED)
-def create_chat_room(
+async def create_chat_room(
     chat_in: ChatCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
     """
     새 채팅방 생성 (종목별 채팅방)
     - stock_code가 전달되면 동일 사용자/종목의 활성 방이 있으면 그 방을 반환
     """
-    return create_chat_room_for_user(db, current_user=current_user, chat_in=chat_in)
+    return await create_chat_room_for_user(db, current_user=current_user, chat_in=chat_in)
 
 
 @router.get("/rooms/by-stock/{stock_code}", response_model=ChatRead)
-def get_chat_room_by_stock(
+async def get_chat_room_by_stock(
     stock_code: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
     """현재 사용자의 특정 종목 채팅방 조회"""
-    return get_chat_room_by_stock_for_user(db, current_user=current_user, stock_code=stock_code)
+    return await get_chat_room_by_stock_for_user(db, current_user=current_user, stock_code=stock_code)
 
 
 @router.patch("/rooms/{room_id}", response_model=ChatRead)
-def update_chat_room(
+async def update_chat_room(
     room_id: int,
     chat_in: ChatUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_request_user),
 ):
     """채팅방 정보를 수정 (현재는 제목 및 휴지통 상태만 지원)"""
-    return update_chat_room_for_user(
+    return await update_chat_room_for_user(
         db,
         room_id=room_id,
         current_user=current_user,
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 # 메시지 생성을 위한 요청 스키마
 # POST /api/rooms/{room_id}/messages
@@ -23,6 +23,19 @@ class MessageRead(BaseModel):
         from_attributes = True
 
 
+def message_read_from_orm(message: Any) -> MessageRead:
+    """DB에서 읽은(이미 검증된) Message 행으로 검증 없이 MessageRead를 생성 (읽기 경로 전용)"""
+    return MessageRead.model_construct(
+        messages_id=message.messages_id,
+        content=message.content,
+        user_id=message.user_id,
+        chat_id=message.chat_id,
+        role=getattr(message.role, "value", message.role),
+        referenced_news=None,
+        created_at=message.created_at,
+    )
+
+
 class ChatCompletionRequest(BaseModel):
     content: str = Field(..., min_length=1, description="사용자가 입력한 메시지")
     system_prompt: Optional[str] = Field(
@@ -37,6 +50,12 @@ class ChatCompletionResponse(BaseModel):
     assistant_message: MessageRead
 
 
+# 응답 생성을 백그라운드로 넘긴 경우(202) 저장된 사용자 메시지만 반환
+# 클라이언트는 user_message.messages_id를 last_message_id로 메시지 목록을 폴링
+class ChatCompletionAcceptedResponse(BaseModel):
+    user_message: MessageRead
+
+
 # 채팅방 정보 조회를 응답 위한 스키마
 # GET /api/rooms
 class ChatRead(BaseModel):
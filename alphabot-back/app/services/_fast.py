@@ -0,0 +1,28 @@
+"""요청 경로에서 자주 호출되는 작은 순수 함수 모음.
+
+외부 의존성 없이 타입을 모두 명시해 두었기 때문에 mypyc로 C 확장 모듈로 컴파일할 수 있습니다.
+(`mypyc app/services/_fast.py`) 컴파일된 모듈이 없으면 이 파일이 그대로 사용됩니다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+_STOCK_CODE_PATTERN = re.compile(r'^[A-Z0-9.\-]{1,20}$')
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_stock_code(raw_code: Optional[str]) -> str:
+    """종목 코드를 정규화(트림, 대문자, 길이 제한) 후 검증합니다."""
+    if raw_code is None:
+        raise ValueError("stock_code is required")
+
+    normalized = WHITESPACE_RE.sub("", raw_code).upper()
+    if not normalized:
+        raise ValueError("stock_code is empty")
+    if len(normalized) > 20:
+        raise ValueError("stock_code must be 20 chars or fewer")
+    if not _STOCK_CODE_PATTERN.match(normalized):
+        raise ValueError("stock_code contains invalid characters")
+    return normalized
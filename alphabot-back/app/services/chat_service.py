@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple, Optional
+from typing import Any, AsyncIterator, List, Sequence, Tuple, Optional
 
+import asyncio
+import hashlib
 import json
+import logging
 
+import orjson
 import os
-import re
+import time
 from contextlib import closing
+from functools import lru_cache
 from fastapi import HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Row, cast, func, insert, literal, literal_column, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
 from app.models.models import Chat, Message, RoleEnum, TrashEnum, User
-from app.schemas.chats import ChatCreate, ChatUpdate, MessageCreate
+from app.db.cache import cache_delete, cache_get_json, cache_set_json, is_cache_configured
+from app.schemas.chats import ChatCreate, ChatRead, ChatUpdate, MessageCreate, message_read_from_orm
+from app.services._fast import WHITESPACE_RE as _WHITESPACE_RE
+from app.services._fast import normalize_stock_code  # noqa: F401 - 라우터에서 이 모듈을 통해 import
 try:
     from app.services.news_vector_service import (
         get_news_session,
@@ -22,8 +33,11 @@ try:
 except Exception as exc:  # pragma: no cover - optional dependency
     get_news_session = None  # type: ignore
     is_news_db_configured = lambda: False  # type: ignore
-    print(f"[chat_service] 뉴스 DB를 사용할 수 없어 RAG 기능을 비활성화합니다: {exc}", flush=True)
+    logging.getLogger(__name__).warning(
+        "[chat_service] 뉴스 DB를 사용할 수 없어 RAG 기능을 비활성화합니다: %s", exc
+    )
 from app.services.rag_service import rag_service
+from app.services.semantic_cache import SemanticResponseCache
 
 # 이 모듈은 OpenAI API를 활용해 챗봇 응답을 생성하고,
 # 대화 이력을 DB에 저장/조회하는 서비스 로직을 제공합니다.
@@ -31,9 +45,17 @@ from app.services.rag_service import rag_service
 
 try:
     # OpenAI Python SDK v1.x 사용
-    from openai import OpenAI  # type: ignore[import-not-found]
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient  # type: ignore[import-not-found]
 except Exception:  # pragma: no cover - openai 미설치/런타임 환경 보호
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
+
+try:
+    # 모델 토크나이저로 프롬프트 토큰 수를 계산 (없으면 바이트 길이로 보수적으로 추정)
+    import tiktoken  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - 선택 의존성
+    tiktoken = None  # type: ignore
 
 
 _OPENAI_MODEL_DEFAULT = os.getenv("OPENAI_MODEL", "gpt-5-mini")  # 기본 모델
@@ -46,20 +68,40 @@ _OPENAI_RESPONSES_MAX_OUTPUT_TOKENS = int(
     os.getenv("OPENAI_RESPONSES_MAX_OUTPUT_TOKENS", "4096")
 )
 
+# OpenAI 연결 풀 크기 (동시 대화 수만큼 keep-alive 연결을 재사용)
+_OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+_OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+_OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+
 _ENABLE_RAG_NEWS_CONFIG = os.getenv("CHAT_ENABLE_RAG_NEWS", "true").lower() not in {
     "0",
     "false",
     "no",
 }
-_ENABLE_RAG_NEWS_AVAILABLE = (
-    is_news_db_configured() if callable(is_news_db_configured) else False
-)
+# 뉴스 DB 설정 여부는 프로세스 수명 동안 바뀌지 않으므로 import 시점에 한 번만 확인
+_ENABLE_RAG_NEWS_AVAILABLE = get_news_session is not None and bool(is_news_db_configured())
 _ENABLE_RAG_NEWS = _ENABLE_RAG_NEWS_CONFIG and _ENABLE_RAG_NEWS_AVAILABLE
 _RAG_NEWS_TOP_K = int(os.getenv("CHAT_RAG_NEWS_TOP_K", "12"))
 _RAG_NEWS_SUMMARY_LIMIT = int(os.getenv("CHAT_RAG_NEWS_SUMMARY_LIMIT", "4"))
 _RAG_NEWS_SIMILARITY_THRESHOLD = float(os.getenv("CHAT_RAG_NEWS_SIMILARITY", "0.35"))
-
-_STOCK_CODE_PATTERN = re.compile(r'^[A-Z0-9.\-]{1,20}$')
+_CHAT_ROOM_CACHE_TTL = int(os.getenv("CHAT_ROOM_CACHE_TTL", "60"))  # (사용자, 종목) -> 채팅방 캐시 TTL(초)
+_CHAT_MAX_INPUT_TOKENS = int(os.getenv("CHAT_MAX_INPUT_TOKENS", "4000"))  # 대화 이력 입력 토큰 예산
+_CHAT_EARLIER_NOTE_TOKENS = int(os.getenv("CHAT_EARLIER_NOTE_TOKENS", "400"))  # 잘린 이전 대화 메모 예산
+_CHAT_EARLIER_NOTE_SNIPPET = 120  # 이전 대화 메모에 넣을 메시지당 최대 글자 수
+_TOKEN_ENCODER_RETRY_SECONDS = 300.0  # 토크나이저 로드 실패 후 재시도까지 바이트 추정을 쓰는 시간(초)
+_TOKEN_ENCODERS: dict = {}  # 모델명 -> 로드된 tiktoken 인코딩
+_TOKEN_ENCODER_FAILED_AT: dict = {}  # 모델명 -> 마지막 로드 실패 시각 (time.monotonic)
+
+# 의미 기반 응답 캐시: 같은 사용자/종목/뉴스 요약에서 유사한 질문이면 이전 응답을 재사용
+_SEMANTIC_CACHE_ENABLED = os.getenv("CHAT_SEMANTIC_CACHE", "true").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+_semantic_cache = SemanticResponseCache(
+    threshold=float(os.getenv("CHAT_SEMANTIC_CACHE_THRESHOLD", "0.92")),
+    ttl_seconds=float(os.getenv("CHAT_SEMANTIC_CACHE_TTL", "600")),
+)
 
 _RESPONSES_ONLY_PREFIXES = (
     "gpt-4.1",
@@ -69,16 +111,21 @@ _RESPONSES_ONLY_PREFIXES = (
     "o1",
 )
 
+logger = logging.getLogger(__name__)
+
 _ASSISTANT_FALLBACK_MESSAGE = (
     "죄송합니다. 지금은 답변을 생성할 수 없어요. 잠시 후 다시 시도해주세요."
 )
 
 
 def _log_openai_debug(message: str) -> None:
-    print(f"[chat_service][debug] {message}", flush=True)
+    logger.debug("[chat_service] %s", message)
 
 
 def _log_responses_payload(prefix: str, payload: Any) -> None:
+    # model_dump/json.dumps는 응답 전체를 순회하므로 DEBUG 레벨이 아니면 바로 반환
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
         if hasattr(payload, "model_dump"):
             payload = payload.model_dump()
@@ -101,21 +148,28 @@ def _get_from_obj(obj: Any, key: str, default: Any | None = None) -> Any | None:
     return getattr(obj, key, default)
 
 
+# dataclass/객체 혹은 dict 형태의 텍스트에서 탐색할 필드
+_NESTED_TEXT_KEYS = ("value", "text", "content")
+
+
 def _coerce_text_value(value: Any) -> Optional[str]:
     """Responses API에서 다양한 텍스트 표현을 문자열로 정규화합니다."""
+    # 대부분은 이미 문자열이므로 가장 먼저 확인해 바로 반환
+    if isinstance(value, str):
+        return value or None
     if value is None:
         return None
-    if isinstance(value, str):
-        return value
     if isinstance(value, (int, float)):
         return str(value)
-    if isinstance(value, (list, tuple)):
-        parts = [part for part in (_coerce_text_value(item) for item in value) if part]
+    if isinstance(value, list):
+        parts = []
+        for item in value:
+            part = _coerce_text_value(item)
+            if part:
+                parts.append(part)
         return "\n".join(parts) if parts else None
 
-    # dataclass/객체 혹은 dict 형태에서 value/text/content 필드를 탐색
-    nested_keys = ("value", "text", "content")
-    for key in nested_keys:
+    for key in _NESTED_TEXT_KEYS:
         nested = _get_from_obj(value, key)
         if nested is None:
             continue
@@ -128,8 +182,9 @@ def _coerce_text_value(value: Any) -> Optional[str]:
     return text_repr or None
 
 
+@lru_cache(maxsize=32)
 def _should_use_responses_api(model: str) -> bool:
-    """Responses API 전용 모델인지 간단한 문자열 규칙으로 판별합니다."""
+    """Responses API 전용 모델인지 간단한 문자열 규칙으로 판별합니다. (모델명별로 결과를 캐시)"""
     normalized = (model or "").lower()
     return normalized.startswith(_RESPONSES_ONLY_PREFIXES)
 
@@ -160,8 +215,15 @@ def _format_messages_for_responses(messages: List[dict]) -> List[dict]:
     return formatted
 
 
+_RESPONSES_OUTPUT_TYPES = frozenset({"message", "output_text"})
+_RESPONSES_CONTENT_TYPES = frozenset({"text", "output_text"})
+
+
 def _extract_text_from_responses(resp: Any) -> str:
-    """Responses API 응답 객체에서 텍스트를 추출합니다."""
+    """Responses API 응답 객체에서 텍스트를 추출합니다.
+
+    응답을 한 번만 dict로 변환한 뒤 output[*].content[*].text를 바로 순회합니다.
+    """
     resp_data = resp
     if hasattr(resp, "model_dump"):
         try:
@@ -169,33 +231,32 @@ def _extract_text_from_responses(resp: Any) -> str:
         except Exception:
             resp_data = resp
 
-    outputs = (
-        _get_from_obj(resp_data, "output")
-        or _get_from_obj(resp_data, "outputs")
-        or []
-    )
-    if outputs and not isinstance(outputs, list):
-        outputs = [outputs]
-
-    for output in outputs:
-        if _get_from_obj(output, "type") not in {"message", "output_text"}:
-            continue
-        contents = _get_from_obj(output, "content") or []
-        if contents and not isinstance(contents, list):
-            contents = [contents]
-        for content in contents:
-            content_type = _get_from_obj(content, "type")
-            if content_type in {"text", "output_text"}:
-                text_value = _coerce_text_value(_get_from_obj(content, "text"))
-                if text_value:
-                    return text_value
-                text_value = _coerce_text_value(_get_from_obj(content, "content"))
-                if text_value:
-                    return text_value
-
-    # SDK가 `output_text` 헬퍼를 제공하는 경우 사용
-    fallback = _coerce_text_value(_get_from_obj(resp_data, "output_text") or _get_from_obj(resp, "output_text"))
-    if fallback:
+    if isinstance(resp_data, dict):
+        outputs = resp_data.get("output") or resp_data.get("outputs") or ()
+        if isinstance(outputs, dict):
+            outputs = (outputs,)
+        for output in outputs:
+            if not isinstance(output, dict) or output.get("type") not in _RESPONSES_OUTPUT_TYPES:
+                continue
+            contents = output.get("content") or ()
+            if isinstance(contents, dict):
+                contents = (contents,)
+            for content in contents:
+                if not isinstance(content, dict) or content.get("type") not in _RESPONSES_CONTENT_TYPES:
+                    continue
+                for key in ("text", "content"):
+                    text_value = content.get(key)
+                    if isinstance(text_value, str) and text_value:
+                        return text_value
+
+        # SDK가 `output_text` 헬퍼를 제공하는 경우 사용
+        fallback = resp_data.get("output_text")
+    else:
+        fallback = None
+
+    if not isinstance(fallback, str):
+        fallback = getattr(resp, "output_text", None)
+    if isinstance(fallback, str) and fallback:
         return fallback
 
     _log_responses_payload("responses API missing text", resp_data)
@@ -234,7 +295,7 @@ def _is_empty_openai_http_error(exc: HTTPException) -> bool:
 
 
 def _fallback_assistant_response(reason: str) -> str:
-    _log_openai_debug(f"OpenAI response empty, returning fallback ({reason})")
+    logger.warning("[chat_service] OpenAI response empty, returning fallback (%s)", reason)
     return _ASSISTANT_FALLBACK_MESSAGE
 
 
@@ -247,32 +308,51 @@ def _get_incomplete_reason(resp: Any) -> Optional[str]:
     return str(reason) if reason else None
 
 
-def _get_openai_client() -> "OpenAI":
-    """환경 변수에서 키를 읽어 OpenAI 클라이언트를 생성합니다. 사용 불가 시 500 오류를 발생시킵니다."""
-    if OpenAI is None:
+_ASYNC_OPENAI_CLIENT: Optional["AsyncOpenAI"] = None
+
+
+def _get_async_openai_client() -> "AsyncOpenAI":
+    """비동기 OpenAI 클라이언트를 반환합니다. 사용 불가 시 500 오류를 발생시킵니다.
+
+    커넥션 풀을 재사용하도록 프로세스당 한 번만 생성합니다.
+    """
+    global _ASYNC_OPENAI_CLIENT
+    if _ASYNC_OPENAI_CLIENT is not None:
+        return _ASYNC_OPENAI_CLIENT
+
+    if AsyncOpenAI is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="OpenAI SDK is not installed on the server.",
         )
 
     # 기본적으로 SDK는 환경변수 OPENAI_API_KEY를 자동으로 읽습니다.
-    # 필요하다면 OpenAI(api_key=...)로 명시적으로 지정할 수 있습니다.
+    # 필요하다면 AsyncOpenAI(api_key=...)로 명시적으로 지정할 수 있습니다.
+    # 연결 풀 한도만 지정하고 타임아웃 등 나머지는 SDK 기본 httpx 설정을 그대로 사용
     try:
-        return OpenAI()
+        _ASYNC_OPENAI_CLIENT = AsyncOpenAI(
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=_OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=_OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=_OPENAI_KEEPALIVE_EXPIRY,
+                )
+            )
+        )
     except Exception as exc:  # pragma: no cover - network/env failures
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to initialize OpenAI client: {exc}",
         )
+    return _ASYNC_OPENAI_CLIENT
 
 
-def _ensure_room_ownership(db: Session, room_id: int, user_id: int) -> Chat:
+async def _ensure_room_ownership(db: AsyncSession, room_id: int, user_id: int) -> Chat:
     """채팅방이 존재하며 현재 사용자 소유인지 검증합니다."""
-    chat = (
-        db.query(Chat)
-        .filter(Chat.chat_id == room_id, Chat.user_id == user_id)
-        .first()
+    result = await db.execute(
+        select(Chat).where(Chat.chat_id == room_id, Chat.user_id == user_id)
     )
+    chat = result.scalars().first()
     if chat is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -281,19 +361,139 @@ def _ensure_room_ownership(db: Session, room_id: int, user_id: int) -> Chat:
     return chat
 
 
-def _load_chat_history(db: Session, room_id: int, limit: int = 30) -> List[Message]:
-    """해당 채팅방의 최근 메시지 이력을 오래된 순으로 조회합니다."""
-    return (
-        db.query(Message)
-        .filter(Message.chat_id == room_id)
-        .order_by(Message.created_at.asc())
+async def _touch_owned_chat(db: AsyncSession, room_id: int, user_id: int) -> Chat:
+    """소유권 검증과 lastchat_at 갱신을 UPDATE ... RETURNING 한 번으로 처리하고 채팅방을 반환합니다."""
+    result = await db.execute(
+        update(Chat)
+        .where(Chat.chat_id == room_id, Chat.user_id == user_id)
+        .values(lastchat_at=func.now())
+        .returning(Chat)
+    )
+    chat = result.scalars().first()
+    if chat is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat room not found or permission denied",
+        )
+    return chat
+
+
+async def _load_chat_history(db: AsyncSession, room_id: int, limit: int = 30) -> List[Row]:
+    """해당 채팅방의 최근 메시지 이력을 오래된 순으로 조회합니다.
+
+    OpenAI 입력에는 role/content만 쓰이므로 두 컬럼만 Row로 조회합니다. (ORM 객체/identity map 생략)
+    """
+    # 최신 limit개를 (chat_id, messages_id) 인덱스 역순으로 가져온 뒤 시간순으로 뒤집음
+    result = await db.execute(
+        select(Message.role, Message.content)
+        .where(Message.chat_id == room_id)
+        .order_by(Message.messages_id.desc())
         .limit(limit)
-        .all()
     )
+    history = list(result.all())
+    history.reverse()
+    return history
+
+
+def _load_token_encoder(model: str) -> Any:
+    """모델 토크나이저를 로드합니다. (BPE 파일이 캐시에 없으면 다운로드하는 블로킹 호출)"""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+        # 알 수 없는 모델명은 최신 모델 인코딩으로 대체
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as exc:  # pragma: no cover - 인코딩 파일 다운로드 실패 등
+        logger.warning("[chat_service] tiktoken unavailable, estimating tokens: %s", exc)
+        return None
+
+
+async def _get_token_encoder(model: str) -> Any:
+    """모델 토크나이저를 반환합니다. (사용 불가 시 None -> 바이트 길이로 추정)
+
+    첫 로드는 다운로드가 이벤트 루프를 막지 않도록 스레드풀에서 수행하고,
+    실패하면 _TOKEN_ENCODER_RETRY_SECONDS 동안만 바이트 추정을 쓴 뒤 다시 시도합니다.
+    """
+    if tiktoken is None:
+        return None
+    encoder = _TOKEN_ENCODERS.get(model)
+    if encoder is not None:
+        return encoder
+    failed_at = _TOKEN_ENCODER_FAILED_AT.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < _TOKEN_ENCODER_RETRY_SECONDS:
+        return None
+
+    encoder = await run_in_threadpool(_load_token_encoder, model)
+    if encoder is None:
+        _TOKEN_ENCODER_FAILED_AT[model] = time.monotonic()
+    else:
+        _TOKEN_ENCODERS[model] = encoder
+        _TOKEN_ENCODER_FAILED_AT.pop(model, None)
+    return encoder
+
+
+def _count_message_tokens(message: dict, encoder: Any) -> int:
+    content = message.get("content") or ""
+    if encoder is not None:
+        return len(encoder.encode(content)) + 4  # 메시지당 역할/구분자 오버헤드
+    # 한글은 대략 글자당 1토큰(UTF-8 3바이트), 영문은 더 적으므로 보수적인 추정치
+    return len(content.encode("utf-8")) // 3 + 4
+
 
+def _trim_messages_by_tokens(
+    messages: List[dict],
+    *,
+    max_input_tokens: int = _CHAT_MAX_INPUT_TOKENS,
+    encoder: Any = None,
+) -> List[dict]:
+    """시스템 메시지와 최근 대화만 토큰 예산 안에 남기고, 잘린 이전 대화는 짧은 메모로 접습니다.
+
+    가장 최근 메시지(현재 질문)는 예산을 넘더라도 항상 포함합니다. encoder가 없으면 바이트 길이로 추정합니다.
+    """
+    system_messages = [m for m in messages if m.get("role") == "system"]
+    turns = [m for m in messages if m.get("role") != "system"]
+
+    budget = max_input_tokens - sum(_count_message_tokens(m, encoder) for m in system_messages)
+    kept: List[dict] = []
+    for message in reversed(turns):
+        cost = _count_message_tokens(message, encoder)
+        if kept and cost > budget:
+            break
+        kept.append(message)
+        budget -= cost
+    kept.reverse()
+
+    dropped = turns[: len(turns) - len(kept)]
+    if not dropped:
+        return messages
+
+    # 잘린 이전 대화는 최근 것부터 짧게 요약해 메모 예산만큼만 시스템 메시지로 전달
+    note_lines: List[str] = []
+    note_budget = _CHAT_EARLIER_NOTE_TOKENS
+    for message in reversed(dropped):
+        snippet = _WHITESPACE_RE.sub(" ", message.get("content") or "").strip()
+        if len(snippet) > _CHAT_EARLIER_NOTE_SNIPPET:
+            snippet = f"{snippet[:_CHAT_EARLIER_NOTE_SNIPPET]}..."
+        line = {"role": "system", "content": f"- {message.get('role')}: {snippet}"}
+        note_budget -= _count_message_tokens(line, encoder)
+        if note_budget < 0:
+            break
+        note_lines.append(line["content"])
+    note_lines.reverse()
+
+    trimmed = list(system_messages)
+    if note_lines:
+        trimmed.append(
+            {"role": "system", "content": "[이전 대화 요약]\n" + "\n".join(note_lines)}
+        )
+    return trimmed + kept
 
-def _convert_history_to_openai_messages(history: List[Message], system_prompt: str | None = None) -> List[dict]:
-    """DB의 메시지 이력을 OpenAI Chat Completions 형식으로 변환합니다."""
+
+def _convert_history_to_openai_messages(
+    history: Sequence[Row | Message], system_prompt: str | None = None
+) -> List[dict]:
+    """DB의 메시지 이력(role/content를 가진 Row 또는 Message)을 OpenAI Chat Completions 형식으로 변환합니다."""
     messages: List[dict] = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
@@ -305,7 +505,7 @@ def _convert_history_to_openai_messages(history: List[Message], system_prompt: s
     return messages
 
 
-def _extract_latest_user_text(history: List[Message]) -> Optional[str]:
+def _extract_latest_user_text(history: Sequence[Row | Message]) -> Optional[str]:
     """대화 이력에서 가장 최근 사용자 메시지 내용을 찾습니다."""
     for message in reversed(history):
         role_value = message.role.value if hasattr(message.role, "value") else str(message.role)
@@ -314,41 +514,23 @@ def _extract_latest_user_text(history: List[Message]) -> Optional[str]:
     return None
 
 
-def _build_rag_news_summary(
-    stock_code: str | None,
-    *,
-    latest_user_text: str | None = None,
-    max_items: int = _RAG_NEWS_SUMMARY_LIMIT,
-) -> Tuple[Optional[str], List[dict]]:
-    """RAG 기반으로 종목 관련 최신 뉴스 요약을 생성합니다.
-    
-    Returns:
-        (summary_text, news_docs_list)
-    """
-    if not _ENABLE_RAG_NEWS or not stock_code or get_news_session is None:
-        return None, []
+def _search_news_docs(embedding: List[float]) -> List[dict]:
+    """뉴스 DB 세션을 열어 임베딩 하나에 대한 유사 뉴스 청크를 검색합니다. (동기 I/O)"""
+    if not embedding:
+        return []
+    with closing(get_news_session()) as news_db:
+        return rag_service.similarity_search_by_embedding(
+            embedding,
+            news_db,
+            top_k=_RAG_NEWS_TOP_K,
+            similarity_threshold=_RAG_NEWS_SIMILARITY_THRESHOLD,
+        )
 
-    try:
-        with closing(get_news_session()) as news_db:
-            queries = []
-            if latest_user_text:
-                queries.append(latest_user_text)
-            queries.append(stock_code)
-
-            docs: List[dict] = []
-            for query in queries:
-                docs = rag_service.similarity_search(
-                    query=query,
-                    db=news_db,
-                    top_k=_RAG_NEWS_TOP_K,
-                    similarity_threshold=_RAG_NEWS_SIMILARITY_THRESHOLD,
-                )
-                if docs:
-                    break
-    except Exception as exc:  # pragma: no cover - 외부 의존성 실패 시 무시
-        print(f"[chat_service] 뉴스 요약 RAG 실패: {exc}", flush=True)
-        return None, []
 
+def _summarize_news_docs(
+    stock_code: str, docs: List[dict], max_items: int
+) -> Tuple[Optional[str], List[dict]]:
+    """검색된 뉴스 청크로 시스템 프롬프트에 넣을 요약 텍스트를 만듭니다."""
     if not docs:
         return None, []
 
@@ -357,7 +539,7 @@ def _build_rag_news_summary(
         title = doc.get("title") or "제목 없음"
         published_at = doc.get("published_at") or "발행일 미상"
         raw_content = doc.get("content") or ""
-        snippet = re.sub(r"\s+", " ", raw_content).strip()
+        snippet = _WHITESPACE_RE.sub(" ", raw_content).strip()
         if len(snippet) > 200:
             snippet = f"{snippet[:200]}..."
         summary_lines.append(f"{idx}. {title} ({published_at}): {snippet}")
@@ -370,36 +552,74 @@ def _build_rag_news_summary(
     )
 
 
-def _call_openai_chat(
+async def _build_rag_news_summary_async(
+    stock_code: str | None,
+    *,
+    latest_user_text: str | None = None,
+    max_items: int = _RAG_NEWS_SUMMARY_LIMIT,
+) -> Tuple[Optional[str], List[dict]]:
+    """RAG 기반으로 종목 관련 최신 뉴스 요약을 생성합니다.
+
+    사용자 질문/종목코드를 한 번의 임베딩 API 호출로 변환한 뒤 두 벡터 검색을 동시에 실행합니다.
+    (동기 I/O이므로 각각 스레드풀에서 별도 세션으로 실행) 사용자 질문 결과가 있으면 우선 사용합니다.
+
+    Returns:
+        (summary_text, news_docs_list)
+    """
+    if not stock_code:
+        return None, []
+
+    queries = [latest_user_text, stock_code] if latest_user_text else [stock_code]
+    try:
+        embeddings = await run_in_threadpool(rag_service.get_embeddings, queries)
+        results = await asyncio.gather(
+            *(run_in_threadpool(_search_news_docs, embedding) for embedding in embeddings)
+        )
+    except Exception as exc:  # pragma: no cover - 외부 의존성 실패 시 무시
+        logger.warning("[chat_service] 뉴스 요약 RAG 실패: %s", exc)
+        return None, []
+
+    docs = next((result for result in results if result), [])
+    return _summarize_news_docs(stock_code, docs, max_items)
+
+
+async def _call_openai_chat(
     messages: List[dict],
     *,
     model: str = _OPENAI_MODEL_DEFAULT,
     temperature: float = _OPENAI_TEMPERATURE_DEFAULT,
     max_tokens: int = _OPENAI_MAX_TOKENS_DEFAULT,
 ) -> str:
-    """OpenAI Chat Completions API를 호출하여 어시스턴트의 텍스트 응답을 반환합니다."""
-    client = _get_openai_client()
+    """OpenAI Chat Completions API를 호출하여 어시스턴트의 텍스트 응답을 반환합니다.
+
+    응답을 기다리는 동안 스레드를 점유하지 않도록 비동기 클라이언트로 호출합니다.
+    """
+    client = _get_async_openai_client()
 
+    # 디버그 메시지 구성(응답 객체 속성 조회 포함)은 DEBUG 레벨일 때만 수행
+    debug = logger.isEnabledFor(logging.DEBUG)
     try:
-        _log_openai_debug(
-            f"call_openai_chat start model={model} "
-            f"messages={len(messages)} responses_api={_should_use_responses_api(model)}"
-        )
+        if debug:
+            _log_openai_debug(
+                f"call_openai_chat start model={model} "
+                f"messages={len(messages)} responses_api={_should_use_responses_api(model)}"
+            )
         if _should_use_responses_api(model):
             responses_input = _format_messages_for_responses(messages)
             responses_max_tokens = max(max_tokens, _OPENAI_RESPONSES_MIN_OUTPUT_TOKENS)
             responses_max_tokens = min(responses_max_tokens, _OPENAI_RESPONSES_MAX_OUTPUT_TOKENS)
             # Responses API 모델(o*, gpt-4.1+, gpt-5+ 등)은 temperature 파라미터를 받지 않으므로 제외
-            resp = client.responses.create(
+            resp = await client.responses.create(
                 model=model,
                 input=responses_input,
                 max_output_tokens=responses_max_tokens,
             )
-            _log_openai_debug(
-                f"responses.create done output_count="
-                f"{len(_get_from_obj(resp, 'output') or _get_from_obj(resp, 'outputs') or [])} "
-                f"status={_get_from_obj(resp, 'status')} tokens={responses_max_tokens}"
-            )
+            if debug:
+                _log_openai_debug(
+                    f"responses.create done output_count="
+                    f"{len(_get_from_obj(resp, 'output') or _get_from_obj(resp, 'outputs') or [])} "
+                    f"status={_get_from_obj(resp, 'status')} tokens={responses_max_tokens}"
+                )
             incomplete_reason = _get_incomplete_reason(resp)
             if (
                 incomplete_reason == "max_output_tokens"
@@ -413,16 +633,17 @@ def _call_openai_chat(
                     "responses API incomplete due to max_output_tokens – "
                     f"retrying with max_output_tokens={retry_tokens}"
                 )
-                resp = client.responses.create(
+                resp = await client.responses.create(
                     model=model,
                     input=responses_input,
                     max_output_tokens=retry_tokens,
                 )
                 responses_max_tokens = retry_tokens
-                _log_openai_debug(
-                    f"responses retry done status={_get_from_obj(resp, 'status')} "
-                    f"output_count={len(_get_from_obj(resp, 'output') or _get_from_obj(resp, 'outputs') or [])}"
-                )
+                if debug:
+                    _log_openai_debug(
+                        f"responses retry done status={_get_from_obj(resp, 'status')} "
+                        f"output_count={len(_get_from_obj(resp, 'output') or _get_from_obj(resp, 'outputs') or [])}"
+                    )
             try:
                 text = _extract_text_from_responses(resp)
             except HTTPException as exc:
@@ -434,16 +655,17 @@ def _call_openai_chat(
                 return text
             return _fallback_assistant_response("responses API empty string")
 
-        resp = client.chat.completions.create(
+        resp = await client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        _log_openai_debug(
-            f"chat.completions.create done choices={len(resp.choices or [])} "
-            f"finish_reason={_get_from_obj(resp.choices[0], 'finish_reason') if resp.choices else 'none'}"
-        )
+        if debug:
+            _log_openai_debug(
+                f"chat.completions.create done choices={len(resp.choices or [])} "
+                f"finish_reason={_get_from_obj(resp.choices[0], 'finish_reason') if resp.choices else 'none'}"
+            )
         choice = resp.choices[0] if resp.choices else None
         content = _extract_text_from_chat_choice(choice)
         if not content:
@@ -455,77 +677,177 @@ def _call_openai_chat(
             return _fallback_assistant_response("chat completions HTTPException")
         raise
     except Exception as exc:  # pragma: no cover - network failures
-        _log_openai_debug(f"OpenAI chat completion exception: {exc}")
+        logger.exception("[chat_service] OpenAI chat completion exception: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"OpenAI chat completion failed: {exc}",
         )
 
 
-def save_user_message(
-    db: Session, *, room_id: int, current_user: User, message: MessageCreate
+async def save_user_message(
+    db: AsyncSession,
+    *,
+    room_id: int,
+    current_user: User,
+    message: MessageCreate,
+    chat: Chat | None = None,
 ) -> Message:
-    """사용자의 메시지를 해당 채팅방에 저장하고 저장된 레코드를 반환합니다."""
-    chat = _ensure_room_ownership(db, room_id, current_user.user_id)
+    """사용자의 메시지를 해당 채팅방에 저장하고 저장된 레코드를 반환합니다.
 
-    db_message = Message(
-        chat_id=room_id,
-        user_id=current_user.user_id,
-        role=RoleEnum.user,
-        content=message.content,
+    소유권 검증 + lastchat_at 갱신(UPDATE ... RETURNING)과 메시지 저장(INSERT ... RETURNING)
+    두 번의 왕복으로 처리하며, 저장 후 refresh 조회는 하지 않습니다.
+    호출자가 이미 _touch_owned_chat으로 검증/갱신한 채팅방을 chat으로 넘기면 첫 번째 왕복을 생략합니다.
+    """
+    if chat is None:
+        await _touch_owned_chat(db, room_id, current_user.user_id)
+    (db_message,) = await _insert_messages(
+        db,
+        [
+            {
+                "chat_id": room_id,
+                "user_id": current_user.user_id,
+                "role": RoleEnum.user,
+                "content": message.content,
+            }
+        ],
     )
-    db.add(db_message)
-    chat.lastchat_at = func.now()
-    db.commit()
-    db.refresh(db_message)
+    await db.commit()
     return db_message
 
 
-def generate_and_save_assistant_reply(
-    db: Session,
+async def _build_openai_messages(
+    history: Sequence[Row | Message],
     *,
-    room_id: int,
-    current_user: User,
+    stock_code: str | None,
     system_prompt: str | None = None,
-) -> Message:
-    """최근 대화 이력을 바탕으로 OpenAI를 호출해 어시스턴트 응답을 생성하고 저장합니다."""
-    chat = _ensure_room_ownership(db, room_id, current_user.user_id)
+    rag: Tuple[Optional[str], List[dict]] | None = None,
+) -> Tuple[List[dict], List[dict]]:
+    """대화 이력과 RAG 뉴스 요약으로 OpenAI 입력 메시지를 구성합니다.
 
-    history = _load_chat_history(db, room_id=room_id)  # 대화 이력 로드
-    latest_user_text = _extract_latest_user_text(history)
-    rag_summary, news_docs = _build_rag_news_summary(chat.stock_code, latest_user_text=latest_user_text)
+    rag에 미리 계산한 (요약, 뉴스 목록)을 넘기면 RAG 검색을 다시 하지 않습니다.
+
+    Returns:
+        (oai_messages, news_docs)
+    """
+    if rag is None:
+        rag = await _build_rag_news_summary_async(
+            stock_code, latest_user_text=_extract_latest_user_text(history)
+        )
+    rag_summary, news_docs = rag
 
     oai_messages = _convert_history_to_openai_messages(history, system_prompt=system_prompt)  # OpenAI 포맷 변환
     if rag_summary:
         insert_idx = 1 if system_prompt else 0
         oai_messages.insert(insert_idx, {"role": "system", "content": rag_summary})
+    # 긴 대화에서도 입력 토큰(지연 시간/비용)이 예산을 넘지 않도록 오래된 대화를 정리
+    encoder = await _get_token_encoder(_OPENAI_MODEL_DEFAULT)
+    return _trim_messages_by_tokens(oai_messages, encoder=encoder), news_docs
+
+
+def _semantic_cache_key(
+    user_id: int, stock_code: str | None, rag_summary: str | None, system_prompt: str | None
+) -> str:
+    """응답 캐시 키: 사용자 + 종목 + 뉴스 요약/시스템 프롬프트 해시
+
+    다른 사용자의 응답은 재사용하지 않으며, 새 뉴스가 들어오면 자연히 다른 키가 됩니다.
+    """
+    digest = hashlib.blake2b(
+        f"{rag_summary or ''}\x00{system_prompt or ''}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return f"{user_id}:{stock_code or '-'}:{digest}"
+
+
+def _embedding_for_semantic_cache(stock_code: str | None, text: str | None) -> Optional[List[float]]:
+    """응답 캐시 조회용 질문 임베딩
+
+    RAG 검색이 같은 문자열로 이미 만든 임베딩만 재사용하고 임베딩 API는 따로 호출하지 않으므로,
+    RAG가 꺼져 있거나 종목이 없는 채팅방에서는 응답 캐시를 사용하지 않습니다.
+    """
+    if not _SEMANTIC_CACHE_ENABLED or not _ENABLE_RAG_NEWS or not stock_code or not text:
+        return None
+    return rag_service.get_cached_embedding(text) or None
+
+
+def _format_news_section(news_docs: List[dict]) -> str:
+    """참고 뉴스 목록을 어시스턴트 본문 뒤에 붙일 문자열로 만듭니다."""
+    if not news_docs:
+        return ""
+    news_section = "\n\n[참고 뉴스]\n"
+    for idx, doc in enumerate(news_docs, start=1):
+        title = doc.get("title") or "제목 없음"
+        published_at = doc.get("published_at") or "날짜 미상"
+        news_section += f"{idx}. {title} ({published_at})\n"
+    return news_section
+
+
+async def _generate_assistant_text(
+    history: Sequence[Row | Message],
+    *,
+    stock_code: str | None,
+    user_id: int,
+    system_prompt: str | None = None,
+    rag: Tuple[Optional[str], List[dict]] | None = None,
+) -> str:
+    """대화 이력으로 RAG 요약과 OpenAI 응답을 만들어 최종 어시스턴트 본문을 반환합니다.
+
+    DB 세션을 사용하지 않으므로 커넥션을 반납한 상태에서 호출합니다.
+    """
+    if rag is None:
+        rag = await _build_rag_news_summary_async(
+            stock_code, latest_user_text=_extract_latest_user_text(history)
+        )
+    oai_messages, news_docs = await _build_openai_messages(
+        history, stock_code=stock_code, system_prompt=system_prompt, rag=rag
+    )
+
+    cache_key = _semantic_cache_key(user_id, stock_code, rag[0], system_prompt)
+    embedding = _embedding_for_semantic_cache(stock_code, _extract_latest_user_text(history))
+    assistant_text = _semantic_cache.lookup(cache_key, embedding) if embedding else None
+    if assistant_text is None:
+        assistant_text = await _call_openai_chat(oai_messages)  # OpenAI 호출
+        if embedding and assistant_text != _ASSISTANT_FALLBACK_MESSAGE:
+            _semantic_cache.store(cache_key, embedding, assistant_text)
 
-    assistant_text = _call_openai_chat(oai_messages)  # OpenAI 호출
-    
     # 뉴스 정보가 있다면 메시지 본문에 추가
-    if news_docs:
-        news_section = "\n\n[참고 뉴스]\n"
-        for idx, doc in enumerate(news_docs, start=1):
-            title = doc.get("title") or "제목 없음"
-            published_at = doc.get("published_at") or "날짜 미상"
-            news_section += f"{idx}. {title} ({published_at})\n"
-        assistant_text += news_section
-
-    assistant_message = Message(
-        chat_id=room_id,
-        user_id=current_user.user_id,
-        role=RoleEnum.assistant,
-        content=assistant_text,
+    return assistant_text + _format_news_section(news_docs)
+
+
+async def _save_assistant_message(
+    db: AsyncSession, *, room_id: int, user_id: int, content: str
+) -> Message:
+    """어시스턴트 메시지를 저장하고 채팅방의 마지막 대화 시각을 갱신합니다."""
+    (assistant_message,) = await _insert_messages(
+        db,
+        [
+            {
+                "chat_id": room_id,
+                "user_id": user_id,
+                "role": RoleEnum.assistant,
+                "content": content,
+            }
+        ],
+    )
+    await db.execute(
+        update(Chat).where(Chat.chat_id == room_id).values(lastchat_at=func.now())
     )
-    db.add(assistant_message)
-    chat.lastchat_at = func.now()
-    db.commit()
-    db.refresh(assistant_message)
+    await db.commit()
     return assistant_message
 
 
-def create_message_and_reply(
-    db: Session,
+async def _insert_messages(db: AsyncSession, rows: List[dict]) -> List[Message]:
+    """여러 메시지를 한 번의 INSERT ... RETURNING으로 저장하고 입력 순서대로 반환합니다.
+
+    RETURNING으로 PK/created_at을 함께 받아오므로 별도의 refresh 조회가 필요 없습니다.
+    """
+    result = await db.scalars(
+        insert(Message).returning(Message, sort_by_parameter_order=True),
+        rows,
+    )
+    return list(result.all())
+
+
+async def create_message_and_reply(
+    session_factory: async_sessionmaker[AsyncSession],
     *,
     room_id: int,
     current_user: User,
@@ -533,37 +855,404 @@ def create_message_and_reply(
     system_prompt: str | None = None,
 ) -> Tuple[Message, Message]:
     """사용자 메시지를 저장한 뒤 OpenAI를 호출해 응답을 생성/저장하고,
-    (user_message, assistant_message) 튜플로 반환합니다."""
-    user_msg = save_user_message(db, room_id=room_id, current_user=current_user, message=message)
-    assistant_msg = generate_and_save_assistant_reply(
-        db, room_id=room_id, current_user=current_user, system_prompt=system_prompt
+    (user_message, assistant_message) 튜플로 반환합니다.
+
+    OpenAI 호출(수 초) 동안 DB 커넥션을 붙잡지 않도록
+    저장/조회 -> (세션 없이) LLM 호출 -> 저장 순서로 세션을 짧게 나눠 사용합니다.
+    """
+    async with session_factory() as db:
+        # 소유권 검증은 한 번만 하고, 검증된 채팅방을 메시지 저장에 그대로 넘김
+        chat = await _touch_owned_chat(db, room_id, current_user.user_id)
+        stock_code = chat.stock_code
+        # 뉴스 RAG 검색(임베딩 HTTP 호출 + 뉴스 DB)은 메시지 저장/이력 조회와 동시에 시작하되,
+        # 커넥션을 붙잡지 않도록 세션을 닫은 뒤에 결과를 기다림
+        rag_task = asyncio.create_task(
+            _build_rag_news_summary_async(stock_code, latest_user_text=message.content)
+        )
+        try:
+            user_msg = await save_user_message(
+                db, room_id=room_id, current_user=current_user, message=message, chat=chat
+            )
+            history = await _load_chat_history(db, room_id=room_id)
+        except BaseException:
+            rag_task.cancel()
+            raise
+    rag = await rag_task
+
+    assistant_text = await _generate_assistant_text(
+        history,
+        stock_code=stock_code,
+        user_id=current_user.user_id,
+        system_prompt=system_prompt,
+        rag=rag,
     )
+
+    async with session_factory() as db:
+        assistant_msg = await _save_assistant_message(
+            db, room_id=room_id, user_id=current_user.user_id, content=assistant_text
+        )
     return user_msg, assistant_msg
 
 
-def fetch_chat_messages(
-    db: Session,
+async def save_user_message_for_reply(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    room_id: int,
+    current_user: User,
+    message: MessageCreate,
+) -> Tuple[Message, Chat]:
+    """응답 생성을 백그라운드로 넘기기 전에 사용자 메시지만 저장하고 (메시지, 채팅방)을 반환합니다."""
+    async with session_factory() as db:
+        chat = await _touch_owned_chat(db, room_id, current_user.user_id)
+        user_msg = await save_user_message(
+            db, room_id=room_id, current_user=current_user, message=message, chat=chat
+        )
+    return user_msg, chat
+
+
+async def generate_reply_in_background(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    room_id: int,
+    user_id: int,
+    stock_code: str | None,
+    latest_user_text: str,
+    system_prompt: str | None = None,
+) -> None:
+    """응답 전송 후 실행되는 어시스턴트 응답 생성/저장 작업.
+
+    요청 세션과 무관하게 새 세션을 짧게 열어 사용하며, 클라이언트는
+    GET /rooms/{room_id}/messages?last_message_id=... 로 저장된 응답을 조회합니다.
+    """
+    # 뉴스 RAG 검색은 세션 밖에서 시작해 이력 조회와 겹치게 하고, 커넥션을 반납한 뒤 결과를 기다림
+    rag_task = asyncio.create_task(
+        _build_rag_news_summary_async(stock_code, latest_user_text=latest_user_text)
+    )
+    try:
+        async with session_factory() as db:
+            history = await _load_chat_history(db, room_id=room_id)
+        rag = await rag_task
+
+        assistant_text = await _generate_assistant_text(
+            history,
+            stock_code=stock_code,
+            user_id=user_id,
+            system_prompt=system_prompt,
+            rag=rag,
+        )
+
+        async with session_factory() as db:
+            await _save_assistant_message(
+                db, room_id=room_id, user_id=user_id, content=assistant_text
+            )
+    except Exception:  # 응답은 이미 전송되었으므로 traceback과 함께 로그만 남김
+        rag_task.cancel()
+        logger.exception("[chat_service] 백그라운드 응답 생성 실패 room_id=%s", room_id)
+
+
+def _sse_event(payload: dict) -> str:
+    """Server-Sent Events 형식의 data 라인을 만듭니다."""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+
+async def _stream_openai_chat(
+    messages: List[dict],
+    *,
+    model: str = _OPENAI_MODEL_DEFAULT,
+    temperature: float = _OPENAI_TEMPERATURE_DEFAULT,
+    max_tokens: int = _OPENAI_MAX_TOKENS_DEFAULT,
+) -> AsyncIterator[str]:
+    """OpenAI 응답을 생성되는 대로 텍스트 조각 단위로 내보냅니다."""
+    client = _get_async_openai_client()
+    if _should_use_responses_api(model):
+        # Responses API 모델도 output_text delta 이벤트를 받아 생성되는 대로 내보냄
+        # (temperature 미지원, 출력 토큰 한도는 _call_openai_chat과 같은 규칙)
+        responses_max_tokens = min(
+            max(max_tokens, _OPENAI_RESPONSES_MIN_OUTPUT_TOKENS),
+            _OPENAI_RESPONSES_MAX_OUTPUT_TOKENS,
+        )
+        stream = await client.responses.create(
+            model=model,
+            input=_format_messages_for_responses(messages),
+            max_output_tokens=responses_max_tokens,
+            stream=True,
+        )
+        async for event in stream:
+            event_type = getattr(event, "type", None)
+            if event_type == "response.output_text.delta":
+                if event.delta:
+                    yield event.delta
+            elif event_type == "response.incomplete":
+                logger.warning(
+                    "[chat_service] responses stream incomplete reason=%s",
+                    _get_incomplete_reason(event.response),
+                )
+            elif event_type in {"error", "response.failed"}:
+                raise HTTPException(
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    detail=f"OpenAI responses stream failed: {event_type}",
+                )
+        return
+
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta is not None and delta.content:
+            yield delta.content
+
+
+async def stream_message_and_reply(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    room_id: int,
+    current_user: User,
+    message: MessageCreate,
+    system_prompt: str | None = None,
+) -> AsyncIterator[str]:
+    """OpenAI 응답을 SSE 이벤트로 스트리밍하고, 스트림이 끝나면 두 메시지를 저장합니다.
+
+    채팅방 검증과 이력 조회는 스트림 시작 전에 수행하므로 404 등은 일반 HTTP 오류로 반환됩니다.
+    """
+    async with session_factory() as db:
+        chat = await _ensure_room_ownership(db, room_id, current_user.user_id)
+        stock_code = chat.stock_code
+        # 뉴스 RAG 검색은 이력 조회와 동시에 시작하되, 커넥션을 반납한 뒤 결과를 기다림
+        rag_task = asyncio.create_task(
+            _build_rag_news_summary_async(stock_code, latest_user_text=message.content)
+        )
+        try:
+            history = await _load_chat_history(db, room_id=room_id)
+        except BaseException:
+            rag_task.cancel()
+            raise
+    rag = await rag_task
+
+    # 사용자 메시지는 스트림 종료 후 어시스턴트 메시지와 함께 저장하므로 이력에는 임시로만 추가
+    history.append(
+        Message(
+            chat_id=room_id,
+            user_id=current_user.user_id,
+            role=RoleEnum.user,
+            content=message.content,
+        )
+    )
+
+    async def event_generator() -> AsyncIterator[str]:
+        try:
+            oai_messages, news_docs = await _build_openai_messages(
+                history, stock_code=stock_code, system_prompt=system_prompt, rag=rag
+            )
+            cache_key = _semantic_cache_key(current_user.user_id, stock_code, rag[0], system_prompt)
+            embedding = _embedding_for_semantic_cache(stock_code, message.content)
+            cached_text = _semantic_cache.lookup(cache_key, embedding) if embedding else None
+            if cached_text is not None:
+                assistant_text = cached_text
+                yield _sse_event({"type": "delta", "content": cached_text})
+            else:
+                parts: List[str] = []
+                async for text in _stream_openai_chat(oai_messages):
+                    parts.append(text)
+                    yield _sse_event({"type": "delta", "content": text})
+
+                assistant_text = "".join(parts) or _fallback_assistant_response("stream empty")
+                if embedding and assistant_text != _ASSISTANT_FALLBACK_MESSAGE:
+                    _semantic_cache.store(cache_key, embedding, assistant_text)
+            news_section = _format_news_section(news_docs)
+            if news_section:
+                yield _sse_event({"type": "delta", "content": news_section})
+
+            async with session_factory() as db:
+                user_msg, assistant_msg = await _insert_messages(
+                    db,
+                    [
+                        {
+                            "chat_id": room_id,
+                            "user_id": current_user.user_id,
+                            "role": RoleEnum.user,
+                            "content": message.content,
+                        },
+                        {
+                            "chat_id": room_id,
+                            "user_id": current_user.user_id,
+                            "role": RoleEnum.assistant,
+                            "content": assistant_text + news_section,
+                        },
+                    ],
+                )
+                await db.execute(
+                    update(Chat).where(Chat.chat_id == room_id).values(lastchat_at=func.now())
+                )
+                await db.commit()
+
+            yield _sse_event(
+                {
+                    "type": "done",
+                    "user_message": message_read_from_orm(user_msg).model_dump(mode="json"),
+                    "assistant_message": message_read_from_orm(assistant_msg).model_dump(mode="json"),
+                }
+            )
+        except Exception as exc:
+            detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            logger.exception("[chat_service] OpenAI stream failed: %s", detail)
+            yield _sse_event({"type": "error", "detail": detail})
+
+    return event_generator()
+
+
+async def fetch_chat_messages(
+    db: AsyncSession,
     *,
     room_id: int,
     current_user: User,
     last_message_id: int | None = None,
+    verify_owner: bool = True,
+    limit: int | None = None,
 ) -> List[Message]:
-    """채팅방 소유자 검증 후 메시지 목록을 반환합니다."""
-    _ensure_room_ownership(db, room_id, current_user.user_id)
+    """채팅방 소유자 검증 후 메시지 목록을 반환합니다.
 
-    query = db.query(Message).filter(Message.chat_id == room_id)
+    같은 요청에서 이미 소유자를 검증했다면 verify_owner=False로 중복 조회를 생략합니다.
+    limit을 주면 last_message_id 이후 최대 limit개만 반환하며, 마지막 messages_id가 다음 커서가 됩니다.
+    """
+    if verify_owner:
+        await _ensure_room_ownership(db, room_id, current_user.user_id)
+
+    # 응답 스키마는 컬럼만 사용하므로 관계(lazy load)는 막아 N+1 쿼리가 생기지 않도록 함
+    query = (
+        select(Message)
+        .options(raiseload("*"))
+        .where(Message.chat_id == room_id)
+    )
     if last_message_id is not None:
-        query = query.filter(Message.messages_id > last_message_id)
-    return query.order_by(Message.created_at.asc()).all()
+        query = query.where(Message.messages_id > last_message_id)
+    # last_message_id 커서와 같은 키(PK)로 정렬해야 증분 조회 순서가 일관됨
+    query = query.order_by(Message.messages_id.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def get_chat_messages_version(
+    db: AsyncSession,
+    *,
+    room_id: int,
+    current_user: User,
+    last_message_id: int | None = None,
+) -> tuple[Optional[int], int]:
+    """채팅방 소유자 검증 후 (마지막 메시지 ID, 메시지 수)를 반환합니다.
 
+    메시지는 추가만 되므로 이 두 값이 같으면 목록도 같다고 보고 ETag 계산에 사용합니다.
+    """
+    await _ensure_room_ownership(db, room_id, current_user.user_id)
 
-def list_user_chat_rooms(db: Session, *, current_user: User) -> List[Chat]:
-    """사용자가 소유한 모든 채팅방을 반환합니다."""
-    return db.query(Chat).filter(Chat.user_id == current_user.user_id).all()
+    query = select(func.max(Message.messages_id), func.count()).where(Message.chat_id == room_id)
+    if last_message_id is not None:
+        query = query.where(Message.messages_id > last_message_id)
+    last_id, count = (await db.execute(query)).one()
+    return last_id, count
 
 
-def create_chat_room_for_user(
-    db: Session,
+async def list_user_chat_rooms(
+    db: AsyncSession,
+    *,
+    current_user: User,
+    limit: int | None = None,
+    cursor: int | None = None,
+) -> List[Chat]:
+    """사용자가 소유한 채팅방을 최근 대화 순으로 반환합니다.
+
+    cursor에는 이전 페이지 마지막 채팅방의 chat_id를 넘기며,
+    (최근 대화 시각, chat_id) 키셋 기준으로 그 다음 채팅방부터 최대 limit개를 조회합니다.
+    """
+    # 대화가 없는 방은 생성 시각을 기준으로 정렬
+    recent_at = func.coalesce(Chat.lastchat_at, Chat.created_at)
+    query = (
+        select(Chat)
+        .options(raiseload("*"))
+        .where(Chat.user_id == current_user.user_id)
+    )
+    if cursor is not None:
+        cursor_key = (
+            select(recent_at, Chat.chat_id)
+            .where(Chat.chat_id == cursor, Chat.user_id == current_user.user_id)
+            .scalar_subquery()
+        )
+        query = query.where(tuple_(recent_at, Chat.chat_id) < cursor_key)
+    query = query.order_by(recent_at.desc(), Chat.chat_id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+def _chat_room_cache_key(user_id: int, stock_code: str, trash_can: str) -> str:
+    return f"chatroom:{user_id}:{stock_code}:{trash_can}"
+
+
+async def _get_cached_chat(user_id: int, stock_code: str, trash_can: str) -> Optional[Chat]:
+    """캐시에 있는 채팅방을 세션에 속하지 않은 Chat 객체로 반환합니다. (없으면 None)"""
+    cached = await cache_get_json(_chat_room_cache_key(user_id, stock_code, trash_can))
+    if cached is None:
+        return None
+    return Chat(user_id=user_id, **ChatRead.model_validate(cached).model_dump())
+
+
+async def _cache_chat(chat: Chat, trash_can: str) -> None:
+    if not is_cache_configured() or not chat.stock_code:
+        return
+    await cache_set_json(
+        _chat_room_cache_key(chat.user_id, chat.stock_code, trash_can),
+        ChatRead.model_validate(chat).model_dump(mode="json"),
+        _CHAT_ROOM_CACHE_TTL,
+    )
+
+
+async def _find_chat_by_stock(
+    db: AsyncSession, user_id: int, stock_code: str, trash_can: str
+) -> Optional[Chat]:
+    """(사용자, 종목, 휴지통 상태)로 채팅방을 조회합니다. Redis 캐시가 있으면 먼저 확인합니다.
+
+    캐시 히트 시에는 세션에 속하지 않은 Chat 객체를 반환하므로 읽기 용도로만 사용합니다.
+    """
+    cached = await _get_cached_chat(user_id, stock_code, trash_can)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(Chat)
+        .where(
+            Chat.user_id == user_id,
+            Chat.stock_code == stock_code,
+            Chat.trash_can == trash_can,
+        )
+        .order_by(Chat.chat_id.desc())
+    )
+    chat = result.scalars().first()
+    if chat is not None:
+        await _cache_chat(chat, trash_can)
+    return chat
+
+
+async def _invalidate_chat_room_cache(user_id: int, stock_code: str | None) -> None:
+    """채팅방 생성/수정/복원 후 해당 종목의 캐시 항목을 제거합니다."""
+    if not stock_code or not is_cache_configured():
+        return
+    await cache_delete(
+        _chat_room_cache_key(user_id, stock_code, TrashEnum.in_.value),
+        _chat_room_cache_key(user_id, stock_code, TrashEnum.out.value),
+    )
+
+
+async def create_chat_room_for_user(
+    db: AsyncSession,
     *,
     current_user: User,
     chat_in: ChatCreate,
@@ -571,14 +1260,8 @@ def create_chat_room_for_user(
     """사용자의 종목 채팅방을 생성하거나 기존 방을 반환합니다."""
     existing_chat = None
     if chat_in.stock_code:
-        existing_chat = (
-            db.query(Chat)
-            .filter(
-                Chat.user_id == current_user.user_id,
-                Chat.stock_code == chat_in.stock_code,
-                Chat.trash_can == TrashEnum.in_.value,
-            )
-            .first()
+        existing_chat = await _find_chat_by_stock(
+            db, current_user.user_id, chat_in.stock_code, TrashEnum.in_.value
         )
     if existing_chat:
         return existing_chat
@@ -589,45 +1272,39 @@ def create_chat_room_for_user(
         stock_code=chat_in.stock_code,
     )
     db.add(new_chat)
-    db.commit()
-    db.refresh(new_chat)
+    await db.commit()
+    await db.refresh(new_chat)
+    await _invalidate_chat_room_cache(current_user.user_id, new_chat.stock_code)
     return new_chat
 
 
-def get_chat_room_by_stock_for_user(
-    db: Session,
+async def get_chat_room_by_stock_for_user(
+    db: AsyncSession,
     *,
     current_user: User,
     stock_code: str,
 ) -> Chat:
     """특정 종목의 채팅방을 조회합니다."""
-    chat = (
-        db.query(Chat)
-        .filter(
-            Chat.user_id == current_user.user_id,
-            Chat.stock_code == stock_code,
-            Chat.trash_can == TrashEnum.in_.value,
-        )
-        .first()
+    chat = await _find_chat_by_stock(
+        db, current_user.user_id, stock_code, TrashEnum.in_.value
     )
     if not chat:
         raise HTTPException(status_code=404, detail="Chat room for stock not found")
     return chat
 
 
-def update_chat_room_for_user(
-    db: Session,
+async def update_chat_room_for_user(
+    db: AsyncSession,
     *,
     room_id: int,
     current_user: User,
     chat_in: ChatUpdate,
 ) -> Chat:
     """채팅방 정보를 수정합니다."""
-    chat = (
-        db.query(Chat)
-        .filter(Chat.chat_id == room_id, Chat.user_id == current_user.user_id)
-        .first()
+    result = await db.execute(
+        select(Chat).where(Chat.chat_id == room_id, Chat.user_id == current_user.user_id)
     )
+    chat = result.scalars().first()
     if not chat:
         raise HTTPException(status_code=404, detail="Chat room not found or permission denied")
 
@@ -649,73 +1326,109 @@ def update_chat_room_for_user(
     if not updated:
         return chat
 
-    db.commit()
-    db.refresh(chat)
+    await db.commit()
+    await db.refresh(chat)
+    await _invalidate_chat_room_cache(current_user.user_id, chat.stock_code)
     return chat
 
 
+async def get_active_chat_by_stock(db: AsyncSession, user_id: int, stock_code: str) -> Optional[Chat]:
+    """해당 로그인 사용자가 보유한 활성(휴지통 아님) 종목 채팅방을 반환합니다."""
+    result = await db.execute(
+        select(Chat).where(
+            Chat.user_id == user_id,
+            Chat.stock_code == stock_code,
+            Chat.trash_can == TrashEnum.out.value,
+        )
+    )
+    return result.scalars().first()
 
-def normalize_stock_code(raw_code: str) -> str:
-    """종목 코드를 정규화(트림, 대문자, 길이 제한) 후 검증합니다."""
-    if raw_code is None:
-        raise ValueError("stock_code is required")
-
-    normalized = re.sub(r"\s+", "", raw_code).upper()
-    if not normalized:
-        raise ValueError("stock_code is empty")
-    if len(normalized) > 20:
-        raise ValueError("stock_code must be 20 chars or fewer")
-    if not _STOCK_CODE_PATTERN.match(normalized):
-        raise ValueError("stock_code contains invalid characters")
-    return normalized
 
+async def _upsert_active_chat_postgres(
+    db: AsyncSession, user_id: int, stock_code: str, room_title: str
+) -> Optional[Tuple[Chat, bool]]:
+    """PostgreSQL에서 활성 채팅방 조회/생성을 INSERT ... ON CONFLICT 한 번으로 처리합니다.
 
-def get_active_chat_by_stock(db: Session, user_id: int, stock_code: str) -> Optional[Chat]:
-    """해당 로그인 사용자가 보유한 활성(휴지통 아님) 종목 채팅방을 반환합니다."""
-    return (
-        db.query(Chat)
-        .filter(
+    활성 방이 있으면 그대로(제목 유지) 반환하고, 없으면 새로 만들어 (chat, existed)를 반환합니다.
+    휴지통에 같은 종목 방이 있으면 복원해야 하므로 삽입하지 않고 None을 반환합니다.
+    """
+    trashed_exists = (
+        select(Chat.chat_id)
+        .where(
             Chat.user_id == user_id,
             Chat.stock_code == stock_code,
-            Chat.trash_can == TrashEnum.out.value,
+            Chat.trash_can == TrashEnum.in_.value,
         )
-        .first()
+        .exists()
     )
+    source = select(
+        literal(user_id),
+        literal(room_title),
+        literal(stock_code),
+        cast(literal(TrashEnum.out.value), Chat.trash_can.type),
+    ).where(~trashed_exists)
+    stmt = pg_insert(Chat).from_select(["user_id", "title", "stock_code", "trash_can"], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Chat.user_id, Chat.stock_code],
+        # ux_chat_user_stock_active 부분 인덱스와 같은 조건이어야 충돌 대상으로 추론됨
+        index_where=text("stock_code IS NOT NULL AND trash_can = 'out'"),
+        # 기존 방의 제목은 바꾸지 않는 no-op 갱신 (RETURNING으로 기존 행을 받기 위함)
+        set_={"title": Chat.title},
+    ).returning(Chat, literal_column("xmax <> 0").label("existed"))
+
+    row = (await db.execute(stmt, execution_options={"populate_existing": True})).first()
+    await db.commit()
+    if row is None:
+        return None
+    return row[0], bool(row[1])
 
 
-def upsert_chat_by_stock(
-    db: Session,
+async def upsert_chat_by_stock(
+    db: AsyncSession,
     *,
     user: User,
     stock_code: str,
     title: Optional[str] = None,
 ) -> Tuple[Chat, bool]:
     """종목별 채팅방을 조회하고 없으면 복원하거나 새로 만듭니다."""
-    existing = get_active_chat_by_stock(db, user.user_id, stock_code)
-    if existing:
-        return existing, True
-    
-    trashed = (
-        db.query(Chat)
-        .filter(
-            Chat.user_id == user.user_id,
-            Chat.stock_code == stock_code,
-            Chat.trash_can == TrashEnum.in_.value,
-        )
-        .order_by(Chat.chat_id.desc())
-        .first()
+    cached = await _get_cached_chat(user.user_id, stock_code, TrashEnum.out.value)
+    if cached is not None:
+        return cached, True
+
+    room_title = (title.strip() if title else None) or f"{stock_code} 채팅"
+    if db.get_bind().dialect.name == "postgresql":
+        upserted = await _upsert_active_chat_postgres(db, user.user_id, stock_code, room_title)
+        if upserted is not None:
+            chat, existed = upserted
+            if not existed:
+                await _invalidate_chat_room_cache(user.user_id, stock_code)
+            # 다음 진입은 DB 없이 캐시에서 바로 반환되도록 활성 방을 캐시
+            await _cache_chat(chat, TrashEnum.out.value)
+            return chat, existed
+
+    # 활성 방과 휴지통 방을 한 번에 조회: 활성 방 우선, 같은 상태면 최신 방
+    result = await db.execute(
+        select(Chat)
+        .where(Chat.user_id == user.user_id, Chat.stock_code == stock_code)
+        .order_by((Chat.trash_can == TrashEnum.out.value).desc(), Chat.chat_id.desc())
+        .limit(1)
     )
+    candidate = result.scalars().first()
+    if candidate is not None and candidate.trash_can in (TrashEnum.out, TrashEnum.out.value):
+        await _cache_chat(candidate, TrashEnum.out.value)
+        return candidate, True
+    trashed = candidate
 
     #휴지통에 있을 경우 실행
     if trashed:
         trashed.trash_can = TrashEnum.out.value
         if title:
             trashed.title = title.strip() or trashed.title
-        db.commit()
-        db.refresh(trashed)
+        await db.commit()
+        await db.refresh(trashed)
+        await _invalidate_chat_room_cache(user.user_id, stock_code)
         return trashed, False
 
-    room_title = (title.strip() if title else None) or f"{stock_code} 채팅"
     new_chat = Chat(
         user_id=user.user_id,
         title=room_title,
@@ -725,13 +1438,26 @@ def upsert_chat_by_stock(
     
     db.add(new_chat)
     try:
-        db.commit()
+        await db.commit()
     except IntegrityError:
-        db.rollback()
-        existing = get_active_chat_by_stock(db, user.user_id, stock_code)
+        await db.rollback()
+        existing = await get_active_chat_by_stock(db, user.user_id, stock_code)
         if existing is None:
             raise
         return existing, True
 
-    db.refresh(new_chat)
+    await db.refresh(new_chat)
+    await _invalidate_chat_room_cache(user.user_id, stock_code)
     return new_chat, False
+
+
+async def _rag_news_summary_disabled(
+    stock_code: str | None, **kwargs
+) -> Tuple[Optional[str], List[dict]]:
+    """RAG 비활성화 시 사용하는 빈 요약 (설정/뉴스 DB 분기 없이 바로 반환)"""
+    return None, []
+
+
+if not _ENABLE_RAG_NEWS:
+    # RAG를 쓸 수 없는 프로세스에서는 매 응답마다 설정을 다시 확인하지 않도록 빈 구현으로 교체
+    _build_rag_news_summary_async = _rag_news_summary_disabled
@@ -1,5 +1,7 @@
 import openai  # type: ignore[import-not-found]
 import os
+import threading
+from cachetools import TTLCache
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
@@ -17,9 +19,21 @@ class RAGService:
         )
         self.embedding_model = "text-embedding-3-small"
         self.chat_model = "gpt-5-mini"
+        # 같은 질문을 RAG 검색과 응답 캐시 조회에서 각각 임베딩하지 않도록 잠시 보관
+        self._embedding_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+        self._embedding_cache_lock = threading.Lock()
     
+    def get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        """이미 계산해 둔 임베딩만 반환 (없으면 API를 호출하지 않고 None)"""
+        with self._embedding_cache_lock:
+            return self._embedding_cache.get(text)
+
     def get_embedding(self, text: str) -> List[float]:
         """텍스트를 임베딩 벡터로 변환"""
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(text)
+        if cached is not None:
+            return cached
         if os.getenv("OPENAI_API_KEY") is None:
             print("❌ OPENAI_API_KEY is None", flush=True)
         try:
@@ -30,11 +44,43 @@ class RAGService:
                 timeout=30
             )
             print("임베딩 완료", flush=True)
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            with self._embedding_cache_lock:
+                self._embedding_cache[text] = embedding
+            return embedding
         except Exception as e:
             print(f"임베딩 생성 실패: {e}", flush=True)
             return []
     
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한 번의 임베딩 API 호출로 변환 (캐시에 있는 텍스트는 요청에서 제외)"""
+        embeddings: Dict[str, List[float]] = {}
+        with self._embedding_cache_lock:
+            for text in texts:
+                cached = self._embedding_cache.get(text)
+                if cached is not None:
+                    embeddings[text] = cached
+
+        missing = list(dict.fromkeys(text for text in texts if text not in embeddings))
+        if missing:
+            try:
+                print(f"임베딩 시작 - {len(missing)}건", flush=True)
+                response = self.openai_client.embeddings.create(
+                    input=missing,
+                    model=self.embedding_model,
+                    timeout=30
+                )
+                print("임베딩 완료", flush=True)
+                with self._embedding_cache_lock:
+                    for item in response.data:
+                        text = missing[item.index]
+                        embeddings[text] = item.embedding
+                        self._embedding_cache[text] = item.embedding
+            except Exception as e:
+                print(f"임베딩 생성 실패: {e}", flush=True)
+
+        return [embeddings.get(text, []) for text in texts]
+
     def similarity_search(
         self, 
         query: str, 
@@ -43,93 +89,84 @@ class RAGService:
         similarity_threshold: float = 0.3
     ) -> List[Dict[str, Any]]:
         """쿼리와 유사한 뉴스 기사들을 벡터 검색으로 찾기"""
+        # 쿼리 임베딩
+        print(f"벡터 검색 시작 - 쿼리: {query}", flush=True)
+        query_embedding = self.get_embedding(query)
+        if not query_embedding:
+            print("임베딩 결과가 비어있음", flush=True)
+            return []
+        return self.similarity_search_by_embedding(
+            query_embedding, db, top_k=top_k, similarity_threshold=similarity_threshold
+        )
+
+    def similarity_search_by_embedding(
+        self,
+        query_embedding: List[float],
+        db: Session,
+        top_k: int = 100,
+        similarity_threshold: float = 0.3
+    ) -> List[Dict[str, Any]]:
+        """이미 계산된 임베딩으로 유사한 뉴스 청크를 벡터 검색"""
         try:
-            # 쿼리 임베딩
-            print(f"벡터 검색 시작 - 쿼리: {query}", flush=True)
-            query_embedding = self.get_embedding(query)
-            if not query_embedding:
-                print("임베딩 결과가 비어있음", flush=True)
-                return []
-            
             print(f"벡터 검색 시작 - 임베딩 길이: {len(query_embedding)}", flush=True)
             
-            # 먼저 데이터베이스에 데이터가 있는지 확인
-            count_query = text("SELECT COUNT(*) as total FROM news_chunks")
-            count_result = db.execute(count_query).fetchone()
-            total_chunks = count_result.total if count_result else 0
-            print(f"데이터베이스 총 청크 수: {total_chunks}", flush=True)
-            
-            if total_chunks == 0:
-                print("❌ news_chunks 테이블에 데이터가 없습니다!", flush=True)
-                return []
-            
             # pgvector의 코사인 유사도 검색
             # 벡터를 문자열로 변환하여 전달
             embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
             print(f"벡터 문자열 생성 완료 - 길이: {len(embedding_str)}", flush=True)
-            
-            # 먼저 임계값 없이 상위 결과들 확인
-            debug_query = text("""
-                SELECT id, title, chunk_text, published_at,
-                       1 - (embedding <=> CAST(:query_embedding AS vector)) as similarity
-                FROM news_chunks
-                ORDER BY embedding <=> CAST(:query_embedding AS vector)
-                LIMIT 5
-            """)
-            
-            print("디버그용 상위 5개 결과 확인 시작", flush=True)
-            debug_result = db.execute(debug_query, {"query_embedding": embedding_str})
-            
-            debug_docs = []
-            for row in debug_result:
-                debug_docs.append({
-                    "similarity": float(row.similarity),
-                    "title": row.title[:100] + "..." if len(row.title) > 100 else row.title
-                })
-            
-            print(f"상위 5개 결과의 유사도: {[doc['similarity'] for doc in debug_docs]}", flush=True)
-            print(f"상위 5개 결과의 제목: {[doc['title'] for doc in debug_docs]}", flush=True)
-            
-            # 동적 임계값 조정
-            if debug_docs:
-                max_similarity = max([doc['similarity'] for doc in debug_docs])
-                print(f"최고 유사도: {max_similarity}", flush=True)
-                
-                # 최고 유사도가 임계값보다 낮으면 임계값을 낮춤
-                if max_similarity < similarity_threshold:
-                    adjusted_threshold = max(0.05, max_similarity - 0.15)  # 더 관대하게 조정
-                    print(f"임계값 조정: {similarity_threshold} -> {adjusted_threshold}", flush=True)
-                    similarity_threshold = adjusted_threshold
-                else:
-                    # 충분한 결과를 얻기 위해 임계값을 더 낮춤 (청크 기반이므로)
-                    adjusted_threshold = max(0.1, similarity_threshold - 0.2)
-                    print(f"청크 검색을 위한 임계값 완화: {similarity_threshold} -> {adjusted_threshold}", flush=True)
-                    similarity_threshold = adjusted_threshold
-            
-            # 실제 검색 쿼리
+
+            # 건수 확인 / 디버그용 상위 5개 / 임계값 검색을 따로 보내지 않고
+            # 거리순 상위 top_k개를 한 번에 가져온 뒤 임계값은 메모리에서 적용
+            # (유사도 = 1 - 거리 이므로 거리순 정렬 = 유사도 내림차순)
             query_text = text("""
                 SELECT id, title, chunk_text, published_at,
                        1 - (embedding <=> CAST(:query_embedding AS vector)) as similarity
                 FROM news_chunks
-                WHERE 1 - (embedding <=> CAST(:query_embedding AS vector)) > :threshold
                 ORDER BY embedding <=> CAST(:query_embedding AS vector)
                 LIMIT :limit
             """)
-            
-            print(f"SQL 쿼리 실행 시작 - 임계값: {similarity_threshold}", flush=True)
-            result = db.execute(
+
+            print("SQL 쿼리 실행 시작", flush=True)
+            rows = db.execute(
                 query_text,
                 {
                     "query_embedding": embedding_str,
-                    "threshold": similarity_threshold,
                     "limit": top_k
                 }
-            )
+            ).all()
             print("SQL 쿼리 실행 완료", flush=True)
-            
+
+            if not rows:
+                print("❌ news_chunks 테이블에 데이터가 없습니다!", flush=True)
+                return []
+
+            top_rows = rows[:5]
+            print(f"상위 5개 결과의 유사도: {[float(row.similarity) for row in top_rows]}", flush=True)
+            print(
+                f"상위 5개 결과의 제목: {[row.title[:100] + '...' if row.title and len(row.title) > 100 else row.title for row in top_rows]}",
+                flush=True,
+            )
+
+            # 동적 임계값 조정
+            max_similarity = float(rows[0].similarity)
+            print(f"최고 유사도: {max_similarity}", flush=True)
+
+            # 최고 유사도가 임계값보다 낮으면 임계값을 낮춤
+            if max_similarity < similarity_threshold:
+                adjusted_threshold = max(0.05, max_similarity - 0.15)  # 더 관대하게 조정
+                print(f"임계값 조정: {similarity_threshold} -> {adjusted_threshold}", flush=True)
+                similarity_threshold = adjusted_threshold
+            else:
+                # 충분한 결과를 얻기 위해 임계값을 더 낮춤 (청크 기반이므로)
+                adjusted_threshold = max(0.1, similarity_threshold - 0.2)
+                print(f"청크 검색을 위한 임계값 완화: {similarity_threshold} -> {adjusted_threshold}", flush=True)
+                similarity_threshold = adjusted_threshold
+
             similar_docs = []
             row_count = 0
-            for row in result:
+            for row in rows:
+                if float(row.similarity) <= similarity_threshold:
+                    break
                 row_count += 1
                 similar_docs.append({
                     "id": str(row.id),
@@ -279,6 +316,8 @@ class RAGService:
                 print(f"생성된 쿼리 수: {len(search_queries)}", flush=True)
                 
                 # 각 쿼리로 검색하여 결과 수집
+                # 임베딩은 한 번의 API 호출로 미리 만들어 두고 아래 검색에서 캐시로 재사용
+                self.get_embeddings([query_info["query"] for query_info in search_queries])
                 all_docs = []
                 for i, query_info in enumerate(search_queries):
                     print(f"🔍 검색 {i+1}/{len(search_queries)}: {query_info['query']} (타입: {query_info['type']})", flush=True)
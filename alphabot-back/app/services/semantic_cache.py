@@ -0,0 +1,114 @@
+"""의미(임베딩) 기반 어시스턴트 응답 캐시.
+
+같은 종목에 대해 표현만 조금 다른 질문이 반복되는 경우가 많으므로,
+질문 임베딩의 코사인 유사도가 임계값 이상이면 이전 응답을 재사용해 OpenAI 호출을 생략합니다.
+프로세스 내 메모리 캐시이며, 키(사용자 + 종목 + 뉴스 요약 등)마다 소수의 항목만 보관하므로
+별도 인덱스 없이 numpy 행렬 곱으로 전수 비교합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class _Bucket:
+    __slots__ = ("vectors", "responses", "created_at")
+
+    def __init__(self) -> None:
+        self.vectors: List[np.ndarray] = []
+        self.responses: List[str] = []
+        self.created_at: List[float] = []
+
+
+class SemanticResponseCache:
+    """키별로 (정규화된 임베딩, 응답, 저장 시각)을 보관하는 TTL 캐시"""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.92,
+        ttl_seconds: float = 600.0,
+        max_entries_per_key: int = 64,
+        max_keys: int = 1024,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_key = max_entries_per_key
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        # 스레드풀/이벤트 루프 양쪽에서 접근할 수 있으므로 잠금으로 보호
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def _prune(self, bucket: _Bucket, now: float) -> None:
+        """만료된 항목 제거 (항목은 저장 순서대로이므로 앞에서부터 확인)"""
+        expired = 0
+        for created_at in bucket.created_at:
+            if now - created_at < self.ttl_seconds:
+                break
+            expired += 1
+        if expired:
+            del bucket.vectors[:expired]
+            del bucket.responses[:expired]
+            del bucket.created_at[:expired]
+
+    def lookup(self, key: str, embedding: Sequence[float]) -> Optional[str]:
+        """임계값 이상으로 가장 유사한 이전 응답을 반환 (없으면 None)"""
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return None
+            self._prune(bucket, time.monotonic())
+            if not bucket.vectors:
+                self._buckets.pop(key, None)
+                return None
+            scores = np.stack(bucket.vectors) @ query
+            best = int(np.argmax(scores))
+            if float(scores[best]) < self.threshold:
+                return None
+            self._buckets.move_to_end(key)
+            return bucket.responses[best]
+
+    def store(self, key: str, embedding: Sequence[float], response: str) -> None:
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket()
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                self._prune(bucket, now)
+
+            bucket.vectors.append(vector)
+            bucket.responses.append(response)
+            bucket.created_at.append(now)
+            if len(bucket.vectors) > self.max_entries_per_key:
+                del bucket.vectors[0]
+                del bucket.responses[0]
+                del bucket.created_at[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()